@@ -7,7 +7,6 @@ Uses tkinterdnd2 for proper drag-and-drop handling
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
-from pathlib import Path
 from datetime import datetime
 import sys
 
@@ -18,6 +17,9 @@ except ImportError:
     HAS_DND = False
     TkinterDnD = tk
 
+# Creation time where the platform reports it (macOS), else modification time
+DATE_STAT_ATTR = 'st_birthtime' if hasattr(os.stat_result, 'st_birthtime') else 'st_mtime'
+
 class FolderRenamerGUI:
     def __init__(self, root):
         self.root = root
@@ -91,11 +93,7 @@ class FolderRenamerGUI:
     def get_item_date(self, item_path: str) -> datetime:
         """Get file/folder creation or modification date"""
         try:
-            stat_info = Path(item_path).stat()
-            if hasattr(stat_info, 'st_birthtime'):
-                return datetime.fromtimestamp(stat_info.st_birthtime)
-            else:
-                return datetime.fromtimestamp(stat_info.st_mtime)
+            return datetime.fromtimestamp(getattr(os.stat(item_path), DATE_STAT_ATTR))
         except Exception:
             return datetime.now()
     
@@ -8,6 +8,9 @@ from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 from datetime import datetime
 import os
+import queue
+import stat
+import threading
 
 # Try to import tkinterdnd2 for drag and drop
 try:
@@ -18,6 +21,9 @@ except ImportError:
     DND_AVAILABLE = False
     print("⚠ Drag and drop not available (install tkinterdnd2 for this feature)")
 
+# Creation time where the platform reports it (macOS), else modification time
+DATE_STAT_ATTR = 'st_birthtime' if hasattr(os.stat_result, 'st_birthtime') else 'st_mtime'
+
 class ModernDateRenamerGUI:
     def __init__(self):
         # Create root with drag and drop support if available
@@ -246,44 +252,54 @@ class ModernDateRenamerGUI:
         self.preview_text.delete(1.0, tk.END)
         
         try:
-            preview_content = f"BATCH RENAME PREVIEW\n{'=' * 50}\n\n"
-            preview_content += f"Total items: {len(self.selected_paths)}\n\n"
+            # Collected as parts and inserted into the widget in one call
+            preview_parts = [
+                f"BATCH RENAME PREVIEW\n{'=' * 50}\n\n",
+                f"Total items: {len(self.selected_paths)}\n\n",
+            ]
             
             # Store rename plan
             self.rename_plan = []
             
+            # Fallback prefix for items whose stats can't be read, computed once
+            today_prefix = datetime.now().strftime("%d%m%Y")
+            
             for i, path in enumerate(self.selected_paths, 1):
                 old_name = path.name
+                parent = path.parent
                 
                 # Get file's creation date or modification date
                 try:
                     stat_info = path.stat()
                     # Use creation time on macOS (st_birthtime) or modification time as fallback
-                    if hasattr(stat_info, 'st_birthtime'):
-                        file_date = datetime.fromtimestamp(stat_info.st_birthtime)
-                    else:
-                        file_date = datetime.fromtimestamp(stat_info.st_mtime)
+                    file_date = datetime.fromtimestamp(getattr(stat_info, DATE_STAT_ATTR))
                     
                     date_prefix = file_date.strftime("%d%m%Y")
+                    date_label = file_date.strftime('%Y-%m-%d')
+                    is_file = stat.S_ISREG(stat_info.st_mode)
                 except Exception:
                     # Fallback to today's date if we can't read file stats
-                    date_prefix = datetime.now().strftime("%d%m%Y")
+                    date_prefix = today_prefix
+                    date_label = 'today'
+                    is_file = path.is_file()
                 
                 new_name = f"{date_prefix}_{old_name}"
-                new_path = path.parent / new_name
+                new_path = parent / new_name
                 
-                type_label = "📄" if path.is_file() else "📁"
+                type_label = "📄" if is_file else "📁"
                 
-                preview_content += f"#{i} {type_label} {path.parent.name}/\n"
-                preview_content += f"  From: {old_name}\n"
-                preview_content += f"  To:   {new_name}\n"
-                preview_content += f"  Date: {date_prefix} ({file_date.strftime('%Y-%m-%d') if 'file_date' in locals() else 'today'})\n\n"
+                preview_parts.append(
+                    f"#{i} {type_label} {parent.name}/\n"
+                    f"  From: {old_name}\n"
+                    f"  To:   {new_name}\n"
+                    f"  Date: {date_prefix} ({date_label})\n\n"
+                )
                 
                 self.rename_plan.append((path, new_path))
             
-            preview_content += f"Status: Ready to execute {len(self.selected_paths)} renames"
+            preview_parts.append(f"Status: Ready to execute {len(self.selected_paths)} renames")
             
-            self.preview_text.insert(tk.END, preview_content)
+            self.preview_text.insert(tk.END, "".join(preview_parts))
             self.preview_text.config(state='disabled')
             
             self.changes_previewed = True
@@ -310,23 +326,76 @@ class ModernDateRenamerGUI:
         
         if not result:
             return
-            
+        
+        # Rename on a worker thread so the window stays responsive; results
+        # come back through a queue drained from the Tk event loop
+        self._set_controls_state('disabled')
+        self.rename_results = queue.Queue()
+        self.rename_success_count = 0
+        self.rename_errors = []
+        
+        threading.Thread(target=self._do_renames,
+                         args=(list(self.rename_plan), self.rename_results),
+                         daemon=True).start()
+        self.root.after(50, self._poll_rename_queue, count)
+        
+    def _do_renames(self, plan, results):
+        """Worker thread: rename each planned item and report every outcome"""
         try:
-            success_count = 0
-            errors = []
-            
-            for old_path, new_path in self.rename_plan:
+            for old_path, new_path in plan:
                 try:
                     if new_path.exists():
-                        errors.append(f"Target already exists: {new_path.name}")
+                        results.put((old_path, new_path, False,
+                                     f"Target already exists: {new_path.name}"))
                         continue
                         
                     old_path.rename(new_path)
-                    success_count += 1
+                    results.put((old_path, new_path, True, None))
                     
                 except Exception as e:
-                    errors.append(f"Failed to rename {old_path.name}: {str(e)}")
+                    results.put((old_path, new_path, False,
+                                 f"Failed to rename {old_path.name}: {str(e)}"))
+        finally:
+            # Sentinel: the batch is finished
+            results.put(None)
             
+    def _poll_rename_queue(self, count):
+        """Drain finished renames on the Tk thread and report when done"""
+        finished = False
+        try:
+            while True:
+                item = self.rename_results.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                    
+                _, _, ok, error = item
+                if ok:
+                    self.rename_success_count += 1
+                else:
+                    self.rename_errors.append(error)
+        except queue.Empty:
+            pass
+        
+        if not finished:
+            done = self.rename_success_count + len(self.rename_errors)
+            self.execute_btn.config(text=f"Renaming {done}/{count}...")
+            self.root.after(50, self._poll_rename_queue, count)
+            return
+        
+        self.execute_btn.config(text="Execute Changes")
+        self._set_controls_state('normal')
+        self._show_rename_results(self.rename_success_count, self.rename_errors, count)
+        
+    def _set_controls_state(self, state):
+        """Enable or disable every button while a batch is running"""
+        for button in (self.file_btn, self.folder_btn, self.preview_btn,
+                       self.execute_btn, self.reset_btn):
+            button.config(state=state)
+            
+    def _show_rename_results(self, success_count, errors, count):
+        """Show the outcome of a batch rename"""
+        try:
             # Show results
             if success_count > 0 and not errors:
                 messagebox.showinfo("Success", 
@@ -33,6 +33,9 @@ setup(
         "docker": [
             "docker>=6.0.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
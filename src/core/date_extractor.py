@@ -12,7 +12,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
 
-from ..models.enums import DateFormatStyle
+from ..models.enums import DateFormatStyle, strftime_format
 
 
 class DateExtractorInterface(ABC):
@@ -118,47 +118,61 @@ class DateExtractor(DateExtractorInterface):
             raise FileNotFoundError(f"Path does not exist: {file_path}")
         
         try:
-            stat_result = file_path.stat()
+            return self.creation_date_from_stat(file_path.stat())
             
-            # Platform-specific creation time extraction
-            creation_timestamp = None
+        except (OSError, PermissionError, ValueError) as e:
+            raise OSError(f"Could not read metadata for {file_path}: {e}")
+    
+    def creation_date_from_stat(self, stat_result: os.stat_result) -> datetime:
+        """
+        Derive the creation date from an already-obtained stat result.
+        
+        Applies the same platform strategy as get_creation_date() without
+        touching the filesystem, so callers that already hold a stat result
+        (e.g. from os.scandir) avoid extra syscalls.
+        
+        Args:
+            stat_result: Result of os.stat() or DirEntry.stat() for the item
             
-            if self._platform == 'windows':
-                # Windows: st_ctime is creation time
-                creation_timestamp = stat_result.st_ctime
-                
-            elif self._platform == 'darwin':  # macOS
-                # macOS: Prefer st_birthtime if available and use_birth_time is True
-                if self.use_birth_time and hasattr(stat_result, 'st_birthtime'):
-                    birth_time = getattr(stat_result, 'st_birthtime')
-                    if birth_time > 0:  # Valid birth time
-                        creation_timestamp = birth_time
-                    else:
-                        creation_timestamp = stat_result.st_ctime
+        Returns:
+            Creation datetime with fallback to modification time
+        """
+        # Platform-specific creation time extraction
+        creation_timestamp = None
+        
+        if self._platform == 'windows':
+            # Windows: st_ctime is creation time
+            creation_timestamp = stat_result.st_ctime
+        
+        elif self._platform == 'darwin':  # macOS
+            # macOS: Prefer st_birthtime if available and use_birth_time is True
+            if self.use_birth_time and hasattr(stat_result, 'st_birthtime'):
+                birth_time = getattr(stat_result, 'st_birthtime')
+                if birth_time > 0:  # Valid birth time
+                    creation_timestamp = birth_time
                 else:
                     creation_timestamp = stat_result.st_ctime
-                    
-            else:  # Linux and other Unix-like systems
-                # Linux: st_ctime is inode change time (closest to creation)
+            else:
                 creation_timestamp = stat_result.st_ctime
-            
-            # Fallback to modification time if creation time seems invalid
-            if creation_timestamp is None or creation_timestamp <= 0:
-                creation_timestamp = stat_result.st_mtime
-            
-            # Convert timestamp to datetime
-            creation_date = datetime.fromtimestamp(creation_timestamp)
-            
-            # Sanity check: creation date should not be in the future
-            now = datetime.now()
-            if creation_date > now:
-                # Use modification time instead
-                creation_date = datetime.fromtimestamp(stat_result.st_mtime)
-            
-            return creation_date
-            
-        except (OSError, PermissionError, ValueError) as e:
-            raise OSError(f"Could not read metadata for {file_path}: {e}")
+        
+        else:  # Linux and other Unix-like systems
+            # Linux: st_ctime is inode change time (closest to creation)
+            creation_timestamp = stat_result.st_ctime
+        
+        # Fallback to modification time if creation time seems invalid
+        if creation_timestamp is None or creation_timestamp <= 0:
+            creation_timestamp = stat_result.st_mtime
+        
+        # Convert timestamp to datetime
+        creation_date = datetime.fromtimestamp(creation_timestamp)
+        
+        # Sanity check: creation date should not be in the future
+        now = datetime.now()
+        if creation_date > now:
+            # Use modification time instead
+            creation_date = datetime.fromtimestamp(stat_result.st_mtime)
+        
+        return creation_date
     
     def format_date_prefix(self, date: datetime, style: DateFormatStyle = None) -> str:
         """
@@ -175,7 +189,7 @@ class DateExtractor(DateExtractorInterface):
             style = self.default_style
         
         # Format the date according to the specified style
-        formatted_date = date.strftime(style.strftime_format)
+        formatted_date = date.strftime(strftime_format(style))
         
         # Always append underscore for consistent prefix format
         return f"{formatted_date}_"
@@ -5,17 +5,19 @@ This module provides the FileScanner interface and implementation for discoverin
 files and directories, extracting metadata, and preparing items for processing.
 """
 
+import fnmatch
 import os
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional, Iterator, Set, Callable
+from typing import List, Optional, Iterator, Set, Callable, Iterable
 from datetime import datetime
 
 from ..models import FileSystemItem, ProcessingSession
 from ..models.enums import LogLevel
 from ..core.date_extractor import DateExtractor
 from ..utils.logging import get_operation_logger
-from ..utils.exceptions import FileSystemError, ValidationError, PermissionError
+from ..utils.exceptions import FileSystemError, ValidationError
 
 
 class FileScannerInterface(ABC):
@@ -97,7 +99,7 @@ class FileScanner(FileScannerInterface):
         self.follow_symlinks = follow_symlinks
         self.max_depth = max_depth
         self.file_extensions = set(ext.lower() for ext in (file_extensions or set()))
-        self.exclude_patterns = exclude_patterns or set()
+        self.exclude_patterns = exclude_patterns
         self.progress_callback = progress_callback
         
         self.logger = get_operation_logger(__name__)
@@ -112,6 +114,39 @@ class FileScanner(FileScannerInterface):
             'excluded_items': 0
         }
     
+    @property
+    def exclude_patterns(self) -> Set[str]:
+        """Set of glob patterns excluded from scanning."""
+        return self._exclude_patterns
+    
+    @exclude_patterns.setter
+    def exclude_patterns(self, patterns: Optional[Iterable[str]]):
+        """
+        Set the exclude patterns and precompile them for matching.
+        
+        Patterns without wildcards are matched by direct name comparison,
+        name-only glob patterns are merged into a single regex, and patterns
+        containing a path separator fall back to Path.match(). Name patterns
+        go through os.path.normcase, as do the names checked against them,
+        so they stay case-insensitive on Windows like Path.match().
+        """
+        self._exclude_patterns = set(patterns or ())
+        
+        literal_names = set()
+        name_globs = []
+        path_globs = []
+        for pattern in self._exclude_patterns:
+            if '/' in pattern or os.sep in pattern:
+                path_globs.append(pattern)
+            elif any(char in pattern for char in '*?['):
+                name_globs.append(fnmatch.translate(os.path.normcase(pattern)))
+            else:
+                literal_names.add(os.path.normcase(pattern))
+        
+        self._exclude_names = frozenset(literal_names)
+        self._exclude_regex = re.compile('|'.join(name_globs)) if name_globs else None
+        self._exclude_path_globs = tuple(path_globs)
+    
     def scan_directory(self, directory_path: Path, recursive: bool = True) -> List[FileSystemItem]:
         """
         Scan a directory and return discovered filesystem items.
@@ -209,8 +244,9 @@ class FileScanner(FileScannerInterface):
             return
         
         try:
-            # Get directory contents
-            items = list(directory_path.iterdir())
+            # Get directory contents; DirEntry caches type and stat data
+            with os.scandir(directory_path) as scan_iterator:
+                entries = list(scan_iterator)
             
         except PermissionError as e:
             self.scan_stats['permission_errors'] += 1
@@ -222,28 +258,28 @@ class FileScanner(FileScannerInterface):
             return
         
         # Sort items for consistent ordering
-        items.sort(key=lambda x: (x.is_dir(), x.name.lower()))
+        entries.sort(key=lambda entry: (entry.is_dir(), entry.name.lower()))
         
         # Process files first, then directories
         directories_to_recurse = []
         
-        for item_path in items:
+        for entry in entries:
             try:
-                # Check exclusion rules
-                if self._should_exclude_item(item_path):
+                # Check exclusion rules against the entry's cached name and type
+                if self._should_exclude_entry(entry):
                     continue
                 
                 # Create FileSystemItem
-                file_item = self._create_file_system_item(item_path)
+                file_item = self._create_item_from_entry(entry)
                 if file_item:
                     yield file_item
                     
                     # Queue directories for recursion
-                    if recursive and item_path.is_dir() and not item_path.is_symlink():
-                        directories_to_recurse.append(item_path)
+                    if recursive and file_item.is_directory and not file_item.is_symlink:
+                        directories_to_recurse.append(Path(entry.path))
             
             except Exception as e:
-                self.logger.warning(f"Error processing item {item_path}: {e}")
+                self.logger.warning(f"Error processing item {entry.path}: {e}")
                 continue
         
         # Recurse into subdirectories
@@ -251,6 +287,41 @@ class FileScanner(FileScannerInterface):
             for subdir_path in directories_to_recurse:
                 yield from self._scan_directory_iterator(subdir_path, recursive, current_depth + 1)
     
+    def _create_item_from_entry(self, entry: os.DirEntry) -> Optional[FileSystemItem]:
+        """
+        Create a FileSystemItem from an os.scandir() entry.
+        
+        Reuses the entry's cached stat data instead of re-statting the path.
+        
+        Args:
+            entry: Directory entry for the filesystem item
+            
+        Returns:
+            FileSystemItem object or None if creation fails
+        """
+        try:
+            # Skip symlinks if not following them
+            if entry.is_symlink() and not self.follow_symlinks:
+                self.scan_stats['symlinks_skipped'] += 1
+                return None
+            
+            creation_date = self.date_extractor.creation_date_from_stat(entry.stat())
+            has_date_prefix = self.date_extractor.has_date_prefix(entry.name)
+            
+            file_item = FileSystemItem.from_scandir(entry, creation_date, has_date_prefix)
+            
+            # Update statistics
+            if file_item.is_directory:
+                self.scan_stats['directories_found'] += 1
+            else:
+                self.scan_stats['files_found'] += 1
+            
+            return file_item
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to create FileSystemItem for {entry.path}: {e}")
+            return None
+    
     def _create_file_system_item(self, item_path: Path) -> Optional[FileSystemItem]:
         """
         Create a FileSystemItem from a filesystem path.
@@ -319,25 +390,62 @@ class FileScanner(FileScannerInterface):
         Args:
             item_path: Path to check
             
+        Returns:
+            True if item should be excluded, False otherwise
+        """
+        return self._should_exclude(item_path.name, item_path.is_dir, lambda: item_path)
+    
+    def _should_exclude_entry(self, entry: os.DirEntry) -> bool:
+        """
+        Check if a scandir entry should be excluded based on configured filters.
+        
+        Uses the entry's cached name and type, so no stat call is made; a
+        Path is only built when path glob patterns are configured.
+        
+        Args:
+            entry: Directory entry to check
+            
+        Returns:
+            True if item should be excluded, False otherwise
+        """
+        return self._should_exclude(entry.name, entry.is_dir, lambda: Path(entry.path))
+    
+    def _should_exclude(self, name: str, is_dir: Callable[[], bool],
+                        get_path: Callable[[], Path]) -> bool:
+        """
+        Apply the configured filters to an item.
+        
+        Args:
+            name: Final path component of the item
+            is_dir: Callable reporting whether the item is a directory
+            get_path: Callable returning the item's path, for glob patterns
+            
         Returns:
             True if item should be excluded, False otherwise
         """
         # Hidden file check
-        if not self.include_hidden and item_path.name.startswith('.'):
+        if not self.include_hidden and name.startswith('.'):
             self.scan_stats['hidden_skipped'] += 1
             return True
         
-        # File extension filter
-        if self.file_extensions and not item_path.is_dir():
-            file_ext = item_path.suffix.lower()
+        # File extension filter (same rule as Path.suffix)
+        if self.file_extensions and not is_dir():
+            dot = name.rfind('.')
+            file_ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ''
             if file_ext not in self.file_extensions:
                 self.scan_stats['excluded_items'] += 1
                 return True
         
         # Exclude pattern check
-        if self.exclude_patterns:
-            for pattern in self.exclude_patterns:
-                if item_path.match(pattern):
+        if self._exclude_patterns:
+            key = os.path.normcase(name)
+            if (key in self._exclude_names
+                    or (self._exclude_regex is not None and self._exclude_regex.match(key))):
+                self.scan_stats['excluded_items'] += 1
+                return True
+            if self._exclude_path_globs:
+                item_path = get_path()
+                if any(item_path.match(pattern) for pattern in self._exclude_path_globs):
                     self.scan_stats['excluded_items'] += 1
                     return True
         
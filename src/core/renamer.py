@@ -19,7 +19,7 @@ from ..utils.validators import PrefixValidator
 from ..utils.logging import get_operation_logger
 from ..utils.exceptions import (
     RenameOperationError, FileConflictError, ValidationError, 
-    FileSystemError, PermissionError, BatchOperationError
+    FileSystemError, BatchOperationError
 )
 
 
@@ -192,8 +192,8 @@ class FileRenamer(FileRenamerInterface):
                     self.rename_stats['failed_renames'] += 1
             
             self.logger.end_operation(
-                success=operation.status == OperationStatus.COMPLETED,
-                result=f"Rename {'successful' if operation.status == OperationStatus.COMPLETED else 'failed'}"
+                success=operation.status is OperationStatus.COMPLETED,
+                result=f"Rename {'successful' if operation.status is OperationStatus.COMPLETED else 'failed'}"
             )
             
             return operation
@@ -252,9 +252,9 @@ class FileRenamer(FileRenamerInterface):
                     # Perform single rename
                     updated_operation = self.rename_item(operation)
                     
-                    if updated_operation.status == OperationStatus.COMPLETED:
+                    if updated_operation.status is OperationStatus.COMPLETED:
                         completed_operations.append(updated_operation)
-                    elif updated_operation.status == OperationStatus.FAILED:
+                    elif updated_operation.status is OperationStatus.FAILED:
                         failed_operations.append(updated_operation)
                         
                         # Stop on first failure if rollback needed
@@ -286,7 +286,7 @@ class FileRenamer(FileRenamerInterface):
         except Exception as e:
             # Mark remaining operations as cancelled
             for operation in operations:
-                if operation.status == OperationStatus.PENDING:
+                if operation.status is OperationStatus.PENDING:
                     operation.status = OperationStatus.CANCELLED
             
             self.logger.end_operation(success=False, result=f"Batch operation failed: {e}")
@@ -315,13 +315,15 @@ class FileRenamer(FileRenamerInterface):
             operation_type = OperationType.FILE_RENAME if not item.is_directory else OperationType.FOLDER_RENAME
             target_name = self.date_extractor.generate_target_name(item.name, item.creation_date)
         
-        # Create preview operation
+        # Create preview operation; the target name was generated from a
+        # formatted date above, so the prefix doesn't need re-parsing
         operation = RenameOperation(
             item=item,
             original_name=item.name,
             target_name=target_name,
             operation_type=operation_type,
-            status=OperationStatus.PENDING
+            status=OperationStatus.PENDING,
+            prefix_validated=True
         )
         
         # Validate preview operation
@@ -567,7 +569,7 @@ class RollbackManager:
         rollback_data = {}
         
         for operation in operations:
-            if operation.status == OperationStatus.COMPLETED and operation.rollback_possible:
+            if operation.status is OperationStatus.COMPLETED and operation.rollback_possible:
                 current_path = str(operation.target_path)
                 original_path = str(operation.item.path)
                 rollback_data[current_path] = original_path
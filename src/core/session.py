@@ -157,7 +157,7 @@ class SessionManager:
             raise ProcessingSessionError("No active session for directory scanning")
         
         with self._session_lock:
-            self.current_session.start_time = datetime.now()
+            self.current_session.mark_started()
             self._notify_status_change(SessionStatus.SCANNING, "Scanning directory for files and folders")
         
         operation_id = create_operation_context("scan", self.current_session.target_directory)
@@ -226,7 +226,7 @@ class SessionManager:
                 operations.append(operation)
                 
                 # Log operation type
-                if operation.operation_type == OperationType.SKIPPED:
+                if operation.operation_type is OperationType.SKIPPED:
                     self.logger.debug(f"Will skip {item.name} (already has prefix or excluded)")
                 else:
                     self.logger.debug(f"Will rename {item.name} -> {operation.target_name}")
@@ -237,7 +237,7 @@ class SessionManager:
             
             # Categorize operations for summary
             rename_count = sum(1 for op in operations if op.operation_type in [OperationType.FILE_RENAME, OperationType.FOLDER_RENAME])
-            skip_count = sum(1 for op in operations if op.operation_type == OperationType.SKIPPED)
+            skip_count = sum(1 for op in operations if op.operation_type is OperationType.SKIPPED)
             
             self.logger.end_operation(
                 success=True,
@@ -298,11 +298,11 @@ class SessionManager:
                 
                 # Update counters
                 for operation in updated_operations:
-                    if operation.status == OperationStatus.COMPLETED:
+                    if operation.status is OperationStatus.COMPLETED:
                         self.current_session.processed_count += 1
-                    elif operation.status == OperationStatus.SKIPPED:
+                    elif operation.status is OperationStatus.SKIPPED:
                         self.current_session.skipped_count += 1
-                    elif operation.status == OperationStatus.FAILED:
+                    elif operation.status is OperationStatus.FAILED:
                         self.current_session.error_count += 1
                 
                 # Mark session as completed
@@ -409,7 +409,7 @@ class SessionManager:
             # Mark operations as cancelled
             if self.current_session.rename_operations:
                 for operation in self.current_session.rename_operations:
-                    if operation.status == OperationStatus.PENDING:
+                    if operation.status is OperationStatus.PENDING:
                         operation.status = OperationStatus.CANCELLED
             
             self.current_session.complete_session()
@@ -11,13 +11,14 @@ from tkinterdnd2 import DND_FILES, TkinterDnD
 import threading
 from pathlib import Path
 from typing import Optional, List, Callable
+import logging
 import webbrowser
 from datetime import datetime
 
 try:
     from ..core.session import SessionManager, SessionFactory
     from ..models.enums import ValidationLevel, DateFormatStyle, SessionStatus
-    from ..utils.logging import setup_logging, get_operation_logger
+    from ..utils.logging import setup_logging, get_operation_logger, configure_logger_for_gui
 except ImportError:
     # Handle direct execution - add parent to path
     import sys
@@ -27,7 +28,7 @@ except ImportError:
     
     from core.session import SessionManager, SessionFactory
     from models.enums import ValidationLevel, DateFormatStyle, SessionStatus
-    from utils.logging import setup_logging, get_operation_logger
+    from utils.logging import setup_logging, get_operation_logger, configure_logger_for_gui
 from .progress_dialog import ProgressDialog
 from .results_dialog import ResultsDialog
 from .settings_dialog import SettingsDialog
@@ -76,6 +77,11 @@ class MainWindow:
         self._create_main_interface()
         self._setup_drag_drop()
         
+        # Surface warnings and errors in the status bar; the handler drains its
+        # queue from the Tk main loop, so the callback may touch widgets
+        self.log_handler = configure_logger_for_gui(self._show_log_message, scheduler=self.root.after)
+        self.log_handler.setLevel(logging.WARNING)
+        
         # Center window on screen
         self._center_window()
         
@@ -321,6 +327,10 @@ class MainWindow:
         )
         # Don't grid the progress bar initially
     
+    def _show_log_message(self, message: str, level: str):
+        """Show the latest of a batch of logged messages in the status bar."""
+        self.status_var.set(message.splitlines()[-1])
+    
     def _setup_drag_drop(self):
         """Setup drag-and-drop functionality."""
         # Register drop zone for file drops
@@ -636,6 +646,9 @@ Built with Python and tkinter.
         finally:
             if hasattr(self, 'session_manager'):
                 self.session_manager.cleanup()
+            if hasattr(self, 'log_handler'):
+                logging.getLogger().removeHandler(self.log_handler)
+                self.log_handler.close()
 
 
 def main():
@@ -21,6 +21,36 @@ except ImportError:
     from models.enums import ValidationLevel, DateFormatStyle
 
 
+VALIDATION_LEVEL_DESCRIPTIONS = {
+    ValidationLevel.STRICT: "Maximum safety checks",
+    ValidationLevel.NORMAL: "Standard validation",
+    ValidationLevel.PERMISSIVE: "Minimal checks",
+    ValidationLevel.DISABLED: "No validation (not recommended)"
+}
+
+# Checkbutton tables: (frame key, setting key, label, pady)
+GENERAL_CHECKS = (
+    ('mode', 'dry_run_mode', "Dry Run Mode (Preview only, no actual changes)", (0, 5)),
+    ('backup', 'create_backups', "Create backup copies before renaming", (0, 5)),
+)
+
+PROCESSING_CHECKS = (
+    ('scanning', 'recursive_processing', "Process subdirectories recursively", (0, 10)),
+    ('scanning', 'include_hidden_files', "Include hidden files and folders", (0, 10)),
+    ('scanning', 'follow_symlinks', "Follow symbolic links", 0),
+)
+
+ADVANCED_CHECKS = (
+    ('interface', 'auto_close_results',
+     "Automatically close results dialog after successful processing", (0, 10)),
+    ('interface', 'show_skipped_items', "Show skipped items in results", 0),
+)
+
+BOOLEAN_SETTINGS = tuple(
+    key for _, key, _, _ in GENERAL_CHECKS + PROCESSING_CHECKS + ADVANCED_CHECKS
+)
+
+
 class SettingsDialog:
     """
     Modal settings dialog for configuring application preferences.
@@ -57,14 +87,24 @@ class SettingsDialog:
         
         Returns:
             Updated settings dictionary if OK was clicked, None if cancelled
+            (or if the parent window is withdrawn or being destroyed)
         """
+        # Skip grab/transient work when the parent can't host a dialog
+        if not self.parent.winfo_exists() or not self.parent.winfo_viewable():
+            return None
+        
         # Create modal dialog
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Settings")
         self.dialog.geometry("600x500")
         self.dialog.resizable(False, False)
         self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        try:
+            self.dialog.grab_set()
+        except tk.TclError:
+            # Some window managers refuse the grab; don't leak a half-built dialog
+            self._close_dialog()
+            return None
         
         # Center on parent
         self._center_on_parent()
@@ -83,6 +123,25 @@ class SettingsDialog:
         
         return self.result_settings
     
+    @staticmethod
+    def _date_format_label(format_style: DateFormatStyle) -> str:
+        """Return the combobox label for a date format style."""
+        return f"{format_style.name}: {format_style.example} ({format_style.description})"
+    
+    @staticmethod
+    def _validation_level_label(level: ValidationLevel) -> str:
+        """Return the combobox label for a validation level."""
+        return f"{level.name}: {VALIDATION_LEVEL_DESCRIPTIONS[level]}"
+    
+    def _create_checkbuttons(self, frames: Dict[str, ttk.Frame], checks: tuple):
+        """Create a BooleanVar-backed checkbutton for each entry in a check table."""
+        for frame_key, setting_key, label, pady in checks:
+            var = tk.BooleanVar()
+            self.settings_vars[setting_key] = var
+            ttk.Checkbutton(
+                frames[frame_key], text=label, variable=var
+            ).pack(anchor=tk.W, pady=pady)
+    
     def _create_widgets(self):
         """Create the dialog widgets."""
         # Main container with notebook for categories
@@ -146,27 +205,25 @@ class SettingsDialog:
         
         self.settings_vars['date_format'] = tk.StringVar()
         
-        # Create radio buttons for each date format
-        for format_style in DateFormatStyle:
-            radio = ttk.Radiobutton(
-                date_frame,
-                text=f"{format_style.example} ({format_style.description})",
-                variable=self.settings_vars['date_format'],
-                value=format_style.name
-            )
-            radio.pack(anchor=tk.W, pady=2)
+        # One read-only combobox instead of a radio button per format
+        ttk.Combobox(
+            date_frame,
+            textvariable=self.settings_vars['date_format'],
+            values=[self._date_format_label(style) for style in DateFormatStyle],
+            state='readonly',
+            width=40
+        ).pack(anchor=tk.W)
         
-        # Processing mode settings
+        # Processing mode and backup settings
         mode_frame = ttk.LabelFrame(container, text="Processing Mode", padding="15")
         mode_frame.pack(fill=tk.X, pady=(0, 20))
         
-        self.settings_vars['dry_run_mode'] = tk.BooleanVar()
-        dry_run_check = ttk.Checkbutton(
-            mode_frame,
-            text="Dry Run Mode (Preview only, no actual changes)",
-            variable=self.settings_vars['dry_run_mode']
+        backup_frame = ttk.LabelFrame(container, text="Backup Options", padding="15")
+        backup_frame.pack(fill=tk.X)
+        
+        self._create_checkbuttons(
+            {'mode': mode_frame, 'backup': backup_frame}, GENERAL_CHECKS
         )
-        dry_run_check.pack(anchor=tk.W, pady=(0, 5))
         
         ttk.Label(
             mode_frame,
@@ -175,18 +232,6 @@ class SettingsDialog:
             foreground='gray'
         ).pack(anchor=tk.W)
         
-        # Backup settings
-        backup_frame = ttk.LabelFrame(container, text="Backup Options", padding="15")
-        backup_frame.pack(fill=tk.X)
-        
-        self.settings_vars['create_backups'] = tk.BooleanVar()
-        backup_check = ttk.Checkbutton(
-            backup_frame,
-            text="Create backup copies before renaming",
-            variable=self.settings_vars['create_backups']
-        )
-        backup_check.pack(anchor=tk.W, pady=(0, 5))
-        
         ttk.Label(
             backup_frame,
             text="Creates .backup copies of files before renaming (recommended)",
@@ -206,29 +251,7 @@ class SettingsDialog:
         scanning_frame = ttk.LabelFrame(container, text="File Scanning", padding="15")
         scanning_frame.pack(fill=tk.X, pady=(0, 20))
         
-        self.settings_vars['recursive_processing'] = tk.BooleanVar()
-        recursive_check = ttk.Checkbutton(
-            scanning_frame,
-            text="Process subdirectories recursively",
-            variable=self.settings_vars['recursive_processing']
-        )
-        recursive_check.pack(anchor=tk.W, pady=(0, 10))
-        
-        self.settings_vars['include_hidden_files'] = tk.BooleanVar()
-        hidden_check = ttk.Checkbutton(
-            scanning_frame,
-            text="Include hidden files and folders",
-            variable=self.settings_vars['include_hidden_files']
-        )
-        hidden_check.pack(anchor=tk.W, pady=(0, 10))
-        
-        self.settings_vars['follow_symlinks'] = tk.BooleanVar()
-        symlinks_check = ttk.Checkbutton(
-            scanning_frame,
-            text="Follow symbolic links",
-            variable=self.settings_vars['follow_symlinks']
-        )
-        symlinks_check.pack(anchor=tk.W)
+        self._create_checkbuttons({'scanning': scanning_frame}, PROCESSING_CHECKS)
         
         ttk.Label(
             scanning_frame,
@@ -245,21 +268,14 @@ class SettingsDialog:
         
         self.settings_vars['validation_level'] = tk.StringVar()
         
-        # Create radio buttons for validation levels
-        validation_descriptions = {
-            ValidationLevel.STRICT: "Strict - Maximum safety checks",
-            ValidationLevel.NORMAL: "Normal - Standard validation",
-            ValidationLevel.PERMISSIVE: "Permissive - Minimal checks"
-        }
-        
-        for level in ValidationLevel:
-            radio = ttk.Radiobutton(
-                validation_frame,
-                text=validation_descriptions[level],
-                variable=self.settings_vars['validation_level'],
-                value=level.name
-            )
-            radio.pack(anchor=tk.W, pady=2)
+        # One read-only combobox instead of a radio button per level
+        ttk.Combobox(
+            validation_frame,
+            textvariable=self.settings_vars['validation_level'],
+            values=[self._validation_level_label(level) for level in ValidationLevel],
+            state='readonly',
+            width=40
+        ).pack(anchor=tk.W)
     
     def _create_advanced_tab(self, notebook):
         """Create the advanced settings tab."""
@@ -273,21 +289,7 @@ class SettingsDialog:
         interface_frame = ttk.LabelFrame(container, text="Interface", padding="15")
         interface_frame.pack(fill=tk.X, pady=(0, 20))
         
-        self.settings_vars['auto_close_results'] = tk.BooleanVar()
-        auto_close_check = ttk.Checkbutton(
-            interface_frame,
-            text="Automatically close results dialog after successful processing",
-            variable=self.settings_vars['auto_close_results']
-        )
-        auto_close_check.pack(anchor=tk.W, pady=(0, 10))
-        
-        self.settings_vars['show_skipped_items'] = tk.BooleanVar()
-        show_skipped_check = ttk.Checkbutton(
-            interface_frame,
-            text="Show skipped items in results",
-            variable=self.settings_vars['show_skipped_items']
-        )
-        show_skipped_check.pack(anchor=tk.W)
+        self._create_checkbuttons({'interface': interface_frame}, ADVANCED_CHECKS)
         
         # Theme settings (placeholder for future implementation)
         theme_frame = ttk.LabelFrame(container, text="Appearance", padding="15")
@@ -338,32 +340,19 @@ class SettingsDialog:
     def _initialize_values(self):
         """Initialize dialog values from current settings."""
         # Date format
-        if 'date_format' in self.current_settings:
-            format_style = self.current_settings['date_format']
-            if hasattr(format_style, 'name'):
-                self.settings_vars['date_format'].set(format_style.name)
-            else:
-                self.settings_vars['date_format'].set(DateFormatStyle.ISO_DATE.name)
-        else:
-            self.settings_vars['date_format'].set(DateFormatStyle.ISO_DATE.name)
+        format_style = self.current_settings.get('date_format')
+        if not isinstance(format_style, DateFormatStyle):
+            format_style = DateFormatStyle.ISO_DATE
+        self.settings_vars['date_format'].set(self._date_format_label(format_style))
         
         # Validation level
-        if 'validation_level' in self.current_settings:
-            level = self.current_settings['validation_level']
-            if hasattr(level, 'name'):
-                self.settings_vars['validation_level'].set(level.name)
-            else:
-                self.settings_vars['validation_level'].set(ValidationLevel.NORMAL.name)
-        else:
-            self.settings_vars['validation_level'].set(ValidationLevel.NORMAL.name)
+        level = self.current_settings.get('validation_level')
+        if not isinstance(level, ValidationLevel):
+            level = ValidationLevel.NORMAL
+        self.settings_vars['validation_level'].set(self._validation_level_label(level))
         
         # Boolean settings
-        boolean_settings = [
-            'dry_run_mode', 'recursive_processing', 'include_hidden_files',
-            'follow_symlinks', 'create_backups', 'auto_close_results', 'show_skipped_items'
-        ]
-        
-        for setting in boolean_settings:
+        for setting in BOOLEAN_SETTINGS:
             if setting in self.settings_vars:
                 value = self.current_settings.get(setting, False)
                 self.settings_vars[setting].set(value)
@@ -412,21 +401,16 @@ class SettingsDialog:
         # Collect settings from dialog
         updated_settings = {}
         
-        # Date format
-        format_name = self.settings_vars['date_format'].get()
-        updated_settings['date_format'] = getattr(DateFormatStyle, format_name)
+        # Date format (combobox labels are prefixed with the member name)
+        format_name = self.settings_vars['date_format'].get().split(':', 1)[0]
+        updated_settings['date_format'] = DateFormatStyle[format_name]
         
         # Validation level
-        level_name = self.settings_vars['validation_level'].get()
-        updated_settings['validation_level'] = getattr(ValidationLevel, level_name)
+        level_name = self.settings_vars['validation_level'].get().split(':', 1)[0]
+        updated_settings['validation_level'] = ValidationLevel[level_name]
         
         # Boolean settings
-        boolean_settings = [
-            'dry_run_mode', 'recursive_processing', 'include_hidden_files',
-            'follow_symlinks', 'create_backups', 'auto_close_results', 'show_skipped_items'
-        ]
-        
-        for setting in boolean_settings:
+        for setting in BOOLEAN_SETTINGS:
             if setting in self.settings_vars:
                 updated_settings[setting] = self.settings_vars[setting].get()
         
@@ -454,9 +438,17 @@ class SettingsDialog:
     
     def _on_cancel(self):
         """Handle Cancel button click."""
+        self._remove_variable_traces()
         self.result_settings = None
         self._close_dialog()
     
+    def _remove_variable_traces(self):
+        """Remove any write traces so none fire while the dialog is torn down."""
+        for var in self.settings_vars.values():
+            for modes, callback_name in var.trace_info():
+                if 'write' in modes:
+                    var.trace_remove('write', callback_name)
+    
     def _validate_settings(self, settings: Dict[str, Any]) -> list:
         """
         Validate settings values.
@@ -513,8 +505,15 @@ class SettingsDialog:
     def _close_dialog(self):
         """Close the dialog."""
         if self.dialog and self.dialog.winfo_exists():
-            self.dialog.grab_release()
+            try:
+                self.dialog.grab_release()
+            except tk.TclError:
+                pass
             self.dialog.destroy()
+        
+        # Drop Tk variable references so repeated open/close cycles don't
+        # accumulate orphan Tcl variables in the interpreter
+        self.settings_vars.clear()
 
 
 # Example usage and testing
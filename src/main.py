@@ -7,20 +7,58 @@ including argument parsing, configuration, and workflow execution.
 """
 
 import argparse
+import functools
+import os
+import shutil
+import stat
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional, TextIO, TYPE_CHECKING
 
-from src.core.session import SessionManager, SessionFactory
 from src.models.enums import ValidationLevel, LogLevel, DateFormatStyle
-from src.utils.logging import setup_logging, get_operation_logger
 from src.utils.exceptions import DatePrefixRenamerError
 
+# The session stack and logging setup are imported lazily so that --help and
+# --version return without loading them.
+if TYPE_CHECKING:
+    from src.core.session import SessionManager
 
+
+# Read-only lookup tables from CLI option strings to enum members
+LOG_LEVEL_MAP = MappingProxyType({
+    'debug': LogLevel.DEBUG,
+    'info': LogLevel.INFO,
+    'warning': LogLevel.WARNING,
+    'error': LogLevel.ERROR,
+    'critical': LogLevel.CRITICAL
+})
+
+VALIDATION_MAP = MappingProxyType({
+    'strict': ValidationLevel.STRICT,
+    'normal': ValidationLevel.NORMAL,
+    'permissive': ValidationLevel.PERMISSIVE,
+    'disabled': ValidationLevel.DISABLED
+})
+
+DATE_FORMAT_MAP = MappingProxyType({
+    'ISO_DATE': DateFormatStyle.ISO_DATE,
+    'US_DATE': DateFormatStyle.US_DATE,
+    'COMPACT': DateFormatStyle.COMPACT,
+    'DDMMYYYY': DateFormatStyle.DDMMYYYY,
+    'YEAR_MONTH': DateFormatStyle.YEAR_MONTH
+})
+
+
+@functools.lru_cache(maxsize=1)
 def setup_argument_parser() -> argparse.ArgumentParser:
     """
     Setup command-line argument parser with all supported options.
     
+    The parser is input-independent and never mutated by parse_args(), so
+    it is built once and shared by every call to main().
+    
     Returns:
         Configured ArgumentParser instance
     """
@@ -69,7 +107,7 @@ Examples:
     parser.add_argument(
         '--format', '-f',
         type=str,
-        choices=['ISO_DATE', 'US_DATE', 'COMPACT', 'DDMMYYYY', 'YEAR_MONTH'],
+        choices=tuple(DATE_FORMAT_MAP),
         default='DDMMYYYY',
         help='Date prefix format style (default: DDMMYYYY = DDMMYYYY)'
     )
@@ -78,7 +116,7 @@ Examples:
     parser.add_argument(
         '--validation',
         type=str,
-        choices=['strict', 'normal', 'permissive', 'disabled'],
+        choices=tuple(VALIDATION_MAP),
         default='normal',
         help='Validation level for file operations (default: normal)'
     )
@@ -127,7 +165,7 @@ Examples:
     parser.add_argument(
         '--log-level',
         type=str,
-        choices=['debug', 'info', 'warning', 'error', 'critical'],
+        choices=tuple(LOG_LEVEL_MAP),
         default='info',
         help='Logging level (default: info)'
     )
@@ -176,16 +214,10 @@ def configure_logging(args: argparse.Namespace) -> None:
     Args:
         args: Parsed command-line arguments
     """
-    # Map string to LogLevel enum
-    log_level_mapping = {
-        'debug': LogLevel.DEBUG,
-        'info': LogLevel.INFO,
-        'warning': LogLevel.WARNING,
-        'error': LogLevel.ERROR,
-        'critical': LogLevel.CRITICAL
-    }
+    from src.utils.logging import setup_logging
     
-    log_level = log_level_mapping[args.log_level]
+    # Map string to LogLevel enum
+    log_level = LOG_LEVEL_MAP[args.log_level]
     
     # Setup logging
     setup_logging(
@@ -197,7 +229,7 @@ def configure_logging(args: argparse.Namespace) -> None:
     )
 
 
-def create_session_manager(args: argparse.Namespace) -> SessionManager:
+def create_session_manager(args: argparse.Namespace) -> 'SessionManager':
     """
     Create and configure SessionManager based on command-line arguments.
     
@@ -207,15 +239,10 @@ def create_session_manager(args: argparse.Namespace) -> SessionManager:
     Returns:
         Configured SessionManager instance
     """
-    # Map validation level
-    validation_mapping = {
-        'strict': ValidationLevel.STRICT,
-        'normal': ValidationLevel.NORMAL,
-        'permissive': ValidationLevel.PERMISSIVE,
-        'disabled': ValidationLevel.DISABLED
-    }
+    from src.core.session import SessionFactory
     
-    validation_level = validation_mapping[args.validation]
+    # Map validation level
+    validation_level = VALIDATION_MAP[args.validation]
     
     # Use factory for safe configuration if strict validation
     if validation_level == ValidationLevel.STRICT:
@@ -224,103 +251,132 @@ def create_session_manager(args: argparse.Namespace) -> SessionManager:
         session_manager = SessionFactory.create_default_session_manager(validation_level)
     
     # Configure date format style
-    date_format_mapping = {
-        'ISO_DATE': DateFormatStyle.ISO_DATE,
-        'US_DATE': DateFormatStyle.US_DATE,
-        'COMPACT': DateFormatStyle.COMPACT,
-        'DDMMYYYY': DateFormatStyle.DDMMYYYY,
-        'YEAR_MONTH': DateFormatStyle.YEAR_MONTH
-    }
-    
-    date_style = date_format_mapping[args.format]
+    date_style = DATE_FORMAT_MAP[args.format]
     session_manager.date_extractor.default_style = date_style
     
     # Configure scanner options
-    session_manager.file_scanner.include_hidden = args.include_hidden
-    session_manager.file_scanner.follow_symlinks = args.follow_symlinks
+    scanner_config = {
+        'include_hidden': args.include_hidden,
+        'follow_symlinks': args.follow_symlinks,
+    }
     
     if args.extensions:
-        session_manager.file_scanner.file_extensions = set(args.extensions)
+        # Normalize to lowercase with a leading dot to match Path.suffix.lower()
+        scanner_config['file_extensions'] = frozenset(
+            ext.lower() if ext.startswith('.') else f".{ext.lower()}"
+            for ext in args.extensions
+        )
     
     if args.exclude:
-        session_manager.file_scanner.exclude_patterns = set(args.exclude)
+        scanner_config['exclude_patterns'] = set(args.exclude)
+    
+    apply_component_config(session_manager.file_scanner, scanner_config)
     
     # Configure renamer options
-    session_manager.file_renamer.create_backups = args.backup
-    session_manager.file_renamer.allow_overwrites = args.allow_overwrites
-    session_manager.file_renamer.dry_run_mode = args.dry_run
+    apply_component_config(session_manager.file_renamer, {
+        'create_backups': args.backup,
+        'allow_overwrites': args.allow_overwrites,
+        'dry_run_mode': args.dry_run,
+    })
     
     return session_manager
 
 
-def format_results_text(result, args: argparse.Namespace) -> str:
+def apply_component_config(component: object, config: Dict[str, Any]) -> None:
     """
-    Format operation results as human-readable text.
+    Apply a batch of option values to a session component.
+    
+    Values go through setattr rather than a bulk __dict__ update so that
+    property setters (e.g. FileScanner.exclude_patterns, which precompiles
+    its matchers) still run.
+    
+    Args:
+        component: Scanner, renamer or other component to configure
+        config: Mapping of attribute names to values
+    """
+    for name, value in config.items():
+        setattr(component, name, value)
+
+
+def write_results_text(result, args: argparse.Namespace, out: Optional[TextIO] = None) -> None:
+    """
+    Write operation results as human-readable text.
+    
+    Lines are written straight to the output stream rather than collected
+    and joined, so large result sets are never buffered twice.
     
     Args:
         result: OperationResult instance
         args: Command-line arguments
-        
-    Returns:
-        Formatted text string
+        out: Stream to write to (default: stdout)
     """
-    lines = []
+    write = (out or sys.stdout).write
+    verbose = args.verbose
+    successful = result.successful_renames
+    failed = result.failed_operations
+    skipped = result.skipped_items
     
     # Header
     mode = "DRY RUN" if args.dry_run else "EXECUTION"
-    lines.append(f"\n=== Date Prefix Renamer - {mode} RESULTS ===")
-    lines.append(f"Directory: {args.directory}")
-    lines.append(f"Date Format: {args.format}")
-    lines.append("")
+    write(f"\n=== Date Prefix Renamer - {mode} RESULTS ===\n")
+    write(f"Directory: {args.directory}\n")
+    write(f"Date Format: {args.format}\n")
+    write("\n")
     
     # Summary
-    lines.append("SUMMARY:")
-    lines.append(f"  Total items processed: {result.session.total_items}")
-    lines.append(f"  Successful renames: {len(result.successful_renames)}")
-    lines.append(f"  Failed operations: {len(result.failed_operations)}")
-    lines.append(f"  Skipped items: {len(result.skipped_items)}")
-    lines.append(f"  Execution time: {result.execution_time.total_seconds():.2f} seconds")
-    lines.append(f"  Success rate: {result.success_rate:.1f}%")
-    lines.append("")
+    write("SUMMARY:\n")
+    write(f"  Total items processed: {result.session.total_items}\n")
+    write(f"  Successful renames: {len(successful)}\n")
+    write(f"  Failed operations: {len(failed)}\n")
+    write(f"  Skipped items: {len(skipped)}\n")
+    write(f"  Execution time: {result.execution_time.total_seconds():.2f} seconds\n")
+    write(f"  Success rate: {result.success_rate:.1f}%\n")
+    write("\n")
     
     # Successful operations
-    if result.successful_renames and args.verbose:
-        lines.append("SUCCESSFUL RENAMES:")
-        for op in result.successful_renames:
-            lines.append(f"  ✓ {op.original_name} → {op.target_name}")
-        lines.append("")
+    if successful and verbose:
+        write("SUCCESSFUL RENAMES:\n")
+        for op in successful:
+            write(f"  ✓ {op.original_name} → {op.target_name}\n")
+        write("\n")
     
     # Failed operations
-    if result.failed_operations:
-        lines.append("FAILED OPERATIONS:")
-        for op in result.failed_operations:
-            lines.append(f"  ✗ {op.original_name}: {op.error_message or 'Unknown error'}")
-        lines.append("")
+    if failed:
+        write("FAILED OPERATIONS:\n")
+        for op in failed:
+            write(f"  ✗ {op.original_name}: {op.error_message or 'Unknown error'}\n")
+        write("\n")
     
     # Skipped items
-    if result.skipped_items and args.verbose:
-        lines.append("SKIPPED ITEMS:")
-        for item in result.skipped_items:
-            lines.append(f"  - {item.name} (already has date prefix)")
-        lines.append("")
-    
-    return "\n".join(lines)
+    if skipped and verbose:
+        write("SKIPPED ITEMS:\n")
+        for item in skipped:
+            write(f"  - {item.name} (already has date prefix)\n")
+        write("\n")
 
 
-def format_results_json(result, args: argparse.Namespace) -> str:
+def write_results_json(result, args: argparse.Namespace, out: Optional[TextIO] = None) -> None:
     """
-    Format operation results as JSON.
+    Write operation results as JSON.
+    
+    Uses orjson when it is installed, which encodes the whole document in
+    native code and writes the bytes straight to the stream's buffer.
+    Otherwise the stdlib encoder streams the document onto the output
+    instead of building it as one string first.
     
     Args:
         result: OperationResult instance
         args: Command-line arguments
-        
-    Returns:
-        JSON string
+        out: Stream to write to (default: stdout)
     """
     import json
     from datetime import datetime
     
+    out = out or sys.stdout
+    successful = result.successful_renames
+    failed = result.failed_operations
+    skipped = result.skipped_items
+    
     # Create JSON-serializable data
     data = {
         'execution_mode': 'dry_run' if args.dry_run else 'execution',
@@ -329,9 +385,9 @@ def format_results_json(result, args: argparse.Namespace) -> str:
         'timestamp': datetime.now().isoformat(),
         'summary': {
             'total_items': result.session.total_items,
-            'successful_renames': len(result.successful_renames),
-            'failed_operations': len(result.failed_operations),
-            'skipped_items': len(result.skipped_items),
+            'successful_renames': len(successful),
+            'failed_operations': len(failed),
+            'skipped_items': len(skipped),
             'execution_time_seconds': result.execution_time.total_seconds(),
             'success_rate_percent': result.success_rate
         },
@@ -340,32 +396,100 @@ def format_results_json(result, args: argparse.Namespace) -> str:
                 'original_name': op.original_name,
                 'target_name': op.target_name,
                 'operation_type': str(op.operation_type)
-            } for op in result.successful_renames
+            } for op in successful
         ],
         'failed_operations': [
             {
                 'original_name': op.original_name,
                 'error_message': op.error_message or 'Unknown error'
-            } for op in result.failed_operations
+            } for op in failed
         ],
         'skipped_items': [
             {
                 'name': item.name,
                 'reason': 'already_has_date_prefix'
-            } for item in result.skipped_items
+            } for item in skipped
         ]
     }
     
-    return json.dumps(data, indent=2)
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    buffer = getattr(out, 'buffer', None)
+    if orjson is not None and buffer is not None:
+        out.flush()
+        buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        buffer.flush()
+        return
+    
+    json.dump(data, out, indent=2, ensure_ascii=False)
+    out.write("\n")
+
+
+PROGRESS_MIN_INTERVAL = 0.05  # seconds; terminals can't usefully render faster than ~20 Hz
 
 
 def progress_callback(phase: str, current: int, total: int, message: str):
     """Progress callback for operation updates."""
+    stdout = sys.stdout
+    # One write and one flush per redraw (print() issues separate writes)
     if total > 0:
-        percentage = (current / total) * 100
-        print(f"\r{phase}: [{percentage:6.1f}%] {message}", end='', flush=True)
+        stdout.write(f"\r{phase}: [{current / total * 100:6.1f}%] {message}")
     else:
-        print(f"\r{phase}: {message}", end='', flush=True)
+        stdout.write(f"\r{phase}: {message}")
+    stdout.flush()
+
+
+def make_throttled_progress_callback(min_interval: float = PROGRESS_MIN_INTERVAL):
+    """
+    Create a progress callback that redraws at most once per interval.
+    
+    Phase changes and completion (current >= total) are always shown.
+    
+    Args:
+        min_interval: Minimum number of seconds between redraws
+        
+    Returns:
+        Callback with the same signature as progress_callback
+    """
+    last_time = 0.0
+    last_phase = None
+    
+    def throttled(phase: str, current: int, total: int, message: str):
+        nonlocal last_time, last_phase
+        now = time.monotonic()
+        if (phase == last_phase and now - last_time < min_interval
+                and current < total):
+            return
+        last_time = now
+        last_phase = phase
+        progress_callback(phase, current, total, message)
+    
+    return throttled
+
+
+def make_phase_progress_callback():
+    """
+    Create a progress callback for non-interactive output.
+    
+    Prints one line per phase instead of redrawing a progress line, so
+    piped or logged output isn't flooded with intermediate updates.
+    
+    Returns:
+        Callback with the same signature as progress_callback
+    """
+    last_phase = None
+    
+    def phase_only(phase: str, current: int, total: int, message: str):
+        nonlocal last_phase
+        if phase == last_phase:
+            return
+        last_phase = phase
+        print(f"{phase}: {message}")
+    
+    return phase_only
 
 
 def main() -> int:
@@ -380,24 +504,32 @@ def main() -> int:
         parser = setup_argument_parser()
         args = parser.parse_args()
         
-        # Validate target directory
-        if not args.directory.exists():
+        # Validate target directory with a single stat() call
+        try:
+            directory_stat = os.stat(args.directory)
+        except (FileNotFoundError, NotADirectoryError):
             print(f"Error: Directory does not exist: {args.directory}", file=sys.stderr)
             return 1
         
-        if not args.directory.is_dir():
+        if not stat.S_ISDIR(directory_stat.st_mode):
             print(f"Error: Path is not a directory: {args.directory}", file=sys.stderr)
             return 1
         
         # Configure logging
         configure_logging(args)
-        logger = get_operation_logger(__name__)
         
         # Create session manager
         session_manager = create_session_manager(args)
         
         # Setup progress callback if not quiet
-        progress_cb = None if args.quiet else progress_callback
+        is_tty = sys.stdout.isatty()
+        if args.quiet:
+            progress_cb = None
+        elif is_tty:
+            progress_cb = make_throttled_progress_callback()
+        else:
+            # Carriage-return redraws are meaningless in logs and pipes
+            progress_cb = make_phase_progress_callback()
         
         # Print start message
         if not args.quiet:
@@ -418,17 +550,18 @@ def main() -> int:
             )
         
         # Clear progress line
-        if not args.quiet:
-            print("\r" + " " * 80 + "\r", end='')
+        if not args.quiet and is_tty:
+            width = shutil.get_terminal_size().columns
+            print("\r" + " " * width + "\r", end='')
         
-        # Format and display results
+        # Write results
         if args.output_format == 'json':
-            print(format_results_json(result, args))
+            write_results_json(result, args)
         else:
-            print(format_results_text(result, args))
+            write_results_text(result, args)
         
         # Return appropriate exit code
-        return 0 if result.success_rate == 100.0 else 1
+        return 0 if result.is_full_success else 1
         
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.", file=sys.stderr)
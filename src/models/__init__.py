@@ -5,16 +5,18 @@ This module defines the primary data structures used throughout the application
 for representing files, operations, and processing sessions.
 """
 
+import operator
+import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
-from enum import Enum
 
 from .enums import OperationType, OperationStatus, SessionStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class FileSystemItem:
     """
     Represents a file or directory in the filesystem with metadata for renaming operations.
@@ -37,15 +39,66 @@ class FileSystemItem:
     is_symlink: bool
     has_date_prefix: bool
     size_bytes: int = 0
+    _extension: str = field(init=False, repr=False, compare=False, default="")
     
     def __post_init__(self):
         """Validate the FileSystemItem after creation."""
+        self._extension = self._extension_of(self.name, self.is_directory)
+        self.validate()
+    
+    @staticmethod
+    def _extension_of(name: str, is_directory: bool) -> str:
+        """Return the suffix of name as Path.suffix would (empty for directories)."""
+        if is_directory:
+            return ""
+        dot = name.rfind('.')
+        return name[dot:] if 0 < dot < len(name) - 1 else ""
+    
+    def validate(self):
+        """
+        Check that the item exists and its creation date is plausible.
+        
+        Raises:
+            ValueError: If the path does not exist or the date is in the future
+        """
         if not self.path.exists():
             raise ValueError(f"Path does not exist: {self.path}")
         
         if self.creation_date > datetime.now() + timedelta(days=1):
             raise ValueError(f"Creation date cannot be in the future: {self.creation_date}")
     
+    @classmethod
+    def from_scandir(cls, entry: os.DirEntry, creation_date: datetime,
+                     has_date_prefix: bool) -> 'FileSystemItem':
+        """
+        Build an item from an os.scandir() entry without re-validating it.
+        
+        The entry proves the path exists and its cached stat result supplies
+        the remaining metadata, so no further syscalls are needed.
+        
+        Args:
+            entry: Directory entry produced by os.scandir()
+            creation_date: Creation date derived from the entry's stat result
+            has_date_prefix: Whether the name already has a date prefix
+            
+        Returns:
+            FileSystemItem populated from the entry
+        """
+        stat_result = entry.stat()
+        is_directory = entry.is_dir()
+        
+        item = cls.__new__(cls)
+        item.path = Path(entry.path)
+        item.name = entry.name
+        item.creation_date = creation_date
+        item.modification_date = datetime.fromtimestamp(stat_result.st_mtime)
+        item.is_directory = is_directory
+        item.is_symlink = entry.is_symlink()
+        item.has_date_prefix = has_date_prefix
+        item.size_bytes = 0 if is_directory else stat_result.st_size
+        item._extension = cls._extension_of(entry.name, is_directory)
+        return item
+    
     @property
     def parent_directory(self) -> Path:
         """Get the parent directory of this item."""
@@ -54,10 +107,10 @@ class FileSystemItem:
     @property
     def file_extension(self) -> str:
         """Get the file extension (empty string for directories)."""
-        return self.path.suffix if not self.is_directory else ""
+        return self._extension
 
 
-@dataclass
+@dataclass(slots=True)
 class RenameOperation:
     """
     Represents a single file/folder rename operation with before/after state.
@@ -71,6 +124,8 @@ class RenameOperation:
         error_message: Error details if operation failed
         timestamp: When operation was executed
         rollback_possible: Whether operation can be undone
+        prefix_validated: Whether the caller generated target_name itself, so the
+            date prefix is known to be valid and need not be re-parsed
     """
     item: FileSystemItem
     original_name: str
@@ -80,9 +135,13 @@ class RenameOperation:
     error_message: Optional[str] = None
     timestamp: Optional[datetime] = None
     rollback_possible: bool = True
+    prefix_validated: bool = field(default=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate the RenameOperation after creation."""
+        if self.prefix_validated:
+            return
+        
         # Ensure target name has the expected prefix format
         if not self.target_name.startswith(self.original_name) and "_" in self.target_name:
             prefix = self.target_name.split("_")[0]
@@ -113,7 +172,7 @@ class RenameOperation:
             self.rollback_possible = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingSession:
     """
     Manages a complete directory processing workflow with progress tracking.
@@ -141,11 +200,20 @@ class ProcessingSession:
     processed_count: int = 0
     skipped_count: int = 0
     error_count: int = 0
+    _start_monotonic: float = field(default_factory=time.monotonic, init=False, repr=False)
     
     def __post_init__(self):
         """Initialize session with current timestamp."""
         if self.start_time is None:
             self.start_time = datetime.now()
+        else:
+            # Align the monotonic clock with an explicitly supplied start time
+            self._start_monotonic -= (datetime.now() - self.start_time).total_seconds()
+    
+    def mark_started(self):
+        """Reset the session start time to now."""
+        self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
     
     @property
     def total_items(self) -> int:
@@ -179,13 +247,14 @@ class ProcessingSession:
         if self.start_time is None or self.processed_count == 0:
             return None
         
-        elapsed = datetime.now() - self.start_time
+        # Monotonic clock avoids allocating a datetime on every progress tick
+        elapsed = time.monotonic() - self._start_monotonic
         completed_operations = self.processed_count + self.skipped_count + self.error_count
         
-        if completed_operations == 0:
+        if completed_operations == 0 or elapsed <= 0:
             return None
         
-        rate = completed_operations / elapsed.total_seconds()  # operations per second
+        rate = completed_operations / elapsed  # operations per second
         remaining_operations = self.total_items - completed_operations
         
         if rate > 0:
@@ -210,7 +279,7 @@ class ProcessingSession:
         self.end_time = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationResult:
     """
     Captures the outcome and details of a complete processing session.
@@ -223,6 +292,10 @@ class OperationResult:
         execution_time: Total time taken for processing
         rollback_data: Original names for potential rollback
         summary_message: Human-readable summary of results
+        is_full_success: Whether every operation completed successfully
+    
+    The result is a snapshot of the session at construction time, so the
+    derived statistics are computed once in __post_init__.
     """
     session: ProcessingSession
     successful_renames: List[RenameOperation] = field(default_factory=list)
@@ -230,30 +303,52 @@ class OperationResult:
     skipped_items: List[FileSystemItem] = field(default_factory=list)
     rollback_data: Dict[str, str] = field(default_factory=dict)
     summary_message: str = ""
+    is_full_success: bool = field(init=False, default=False)
+    _execution_time: timedelta = field(init=False, repr=False, default=timedelta(0))
+    _success_rate: float = field(init=False, repr=False, default=100.0)
     
     def __post_init__(self):
         """Generate summary data from the session."""
         self._categorize_operations()
+        self._compute_statistics()
         self._generate_summary_message()
         self._prepare_rollback_data()
     
     @property
     def execution_time(self) -> timedelta:
-        """Calculate total execution time."""
+        """Total execution time."""
+        return self._execution_time
+    
+    def _compute_statistics(self):
+        """Compute execution time and success rate once."""
         if self.session.start_time and self.session.end_time:
-            return self.session.end_time - self.session.start_time
-        return timedelta(0)
+            self._execution_time = self.session.end_time - self.session.start_time
+        
+        total = len(self.session.rename_operations)
+        if total:
+            self._success_rate = (len(self.successful_renames) / total) * 100
+        self.is_full_success = self._success_rate == 100.0
     
     def _categorize_operations(self):
         """Categorize operations by their final status."""
+        skipped_operations = []
+        
+        # Single pass: bucket each operation via one dict lookup on its status
+        buckets = {
+            OperationStatus.COMPLETED: self.successful_renames,
+            OperationStatus.FAILED: self.failed_operations,
+            OperationStatus.SKIPPED: skipped_operations,
+        }
+        get_bucket = buckets.get
+        status_of = operator.attrgetter('status')
+        
         for operation in self.session.rename_operations:
-            if operation.status == OperationStatus.COMPLETED:
-                self.successful_renames.append(operation)
-            elif operation.status == OperationStatus.FAILED:
-                self.failed_operations.append(operation)
-            elif operation.status == OperationStatus.SKIPPED:
-                # Convert to FileSystemItem for consistency
-                self.skipped_items.append(operation.item)
+            bucket = get_bucket(status_of(operation))
+            if bucket is not None:
+                bucket.append(operation)
+        
+        # Convert to FileSystemItem for consistency
+        self.skipped_items.extend([operation.item for operation in skipped_operations])
     
     def _generate_summary_message(self) -> str:
         """Generate human-readable summary of results."""
@@ -272,18 +367,17 @@ class OperationResult:
     
     def _prepare_rollback_data(self):
         """Prepare data for potential rollback operations."""
+        # Work on plain strings rather than building a Path per target
+        join = os.path.join
+        dirname = os.path.dirname
         for operation in self.successful_renames:
             original_path = str(operation.item.path)
-            target_path = str(operation.target_path)
-            self.rollback_data[target_path] = original_path
+            self.rollback_data[join(dirname(original_path), operation.target_name)] = original_path
     
     @property
     def success_rate(self) -> float:
-        """Calculate the success rate as a percentage."""
-        total = len(self.session.rename_operations)
-        if total == 0:
-            return 100.0
-        return (len(self.successful_renames) / total) * 100
+        """The success rate as a percentage."""
+        return self._success_rate
     
     @property
     def has_errors(self) -> bool:
@@ -5,10 +5,56 @@ This module defines the various enumerated types used throughout the application
 for operation types, status tracking, and session management.
 """
 
-from enum import Enum, auto
+import functools
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Callable, Dict
 
 
-class OperationType(Enum):
+class _DisplayNameEnum(Enum):
+    """
+    Base for enumerations whose string form is the member name in title case.
+    
+    The display string is built once per member when the enum class is
+    created, so str() on a member is a plain attribute read.
+    """
+    
+    def __init__(self, *args) -> None:
+        self._display_name = self._name_.replace('_', ' ').title()
+    
+    def __str__(self) -> str:
+        """Return human-readable string representation."""
+        return self._display_name
+
+
+def _with_tables(**tables: Dict[str, Any]) -> Callable[[type], type]:
+    """
+    Class decorator that attaches constant per-member lookup tables to an enum.
+    
+    Each keyword names a read-only property and maps member names to its
+    values. The table is keyed by member, stored on the class as
+    ``_TABLE_<name>`` and the property is a single lookup into it, so no
+    mapping is rebuilt on access.
+    
+    Args:
+        **tables: Property name -> {member name: value}
+        
+    Returns:
+        Decorator that installs the tables and properties on the class
+    """
+    def decorate(cls: type) -> type:
+        for attr, by_name in tables.items():
+            table = {cls[name]: value for name, value in by_name.items()}
+            if len(table) != len(cls):
+                raise ValueError(f"{cls.__name__}.{attr} table does not cover every member")
+            setattr(cls, f"_TABLE_{attr}", table)
+            setattr(cls, attr, property(table.__getitem__))
+        return cls
+    
+    return decorate
+
+
+class OperationType(_DisplayNameEnum):
     """
     Enumeration of different types of rename operations supported by the application.
     
@@ -18,17 +64,13 @@ class OperationType(Enum):
         SKIPPED: Item was skipped (already has prefix, is symlink, etc.)
         BATCH_RENAME: Multiple items processed as a batch operation
     """
-    FILE_RENAME = auto()
-    FOLDER_RENAME = auto()
-    SKIPPED = auto()
-    BATCH_RENAME = auto()
-    
-    def __str__(self) -> str:
-        """Return human-readable string representation."""
-        return self.name.replace('_', ' ').title()
+    FILE_RENAME = 1
+    FOLDER_RENAME = 2
+    SKIPPED = 3
+    BATCH_RENAME = 4
 
 
-class OperationStatus(Enum):
+class OperationStatus(_DisplayNameEnum):
     """
     Enumeration of possible states for a rename operation.
     
@@ -39,35 +81,39 @@ class OperationStatus(Enum):
         FAILED: Operation encountered an error and could not complete
         SKIPPED: Operation was intentionally skipped
         CANCELLED: Operation was cancelled by user request
-    """
-    PENDING = auto()
-    IN_PROGRESS = auto()
-    COMPLETED = auto()
-    FAILED = auto()
-    SKIPPED = auto()
-    CANCELLED = auto()
     
-    def __str__(self) -> str:
-        """Return human-readable string representation."""
-        return self.name.replace('_', ' ').title()
-    
-    @property
-    def is_terminal(self) -> bool:
-        """Check if this status represents a finished operation."""
-        return self in {
-            OperationStatus.COMPLETED,
-            OperationStatus.FAILED,
-            OperationStatus.SKIPPED,
-            OperationStatus.CANCELLED
-        }
+    Members are singletons (pickling round-trips by value to the same
+    object), so statuses can be compared with ``is``.
     
-    @property
-    def is_successful(self) -> bool:
-        """Check if this status represents a successful operation."""
-        return self in {OperationStatus.COMPLETED, OperationStatus.SKIPPED}
+    Attributes:
+        is_terminal: True if this status represents a finished operation
+        is_successful: True if this status represents a successful operation
+    """
+    PENDING = 1
+    IN_PROGRESS = 2
+    COMPLETED = 4
+    FAILED = 8
+    SKIPPED = 16
+    CANCELLED = 32
+
+
+# Status values are distinct bits, so each classification is a single AND
+_OPERATION_TERMINAL_MASK = (
+    OperationStatus.COMPLETED.value
+    | OperationStatus.FAILED.value
+    | OperationStatus.SKIPPED.value
+    | OperationStatus.CANCELLED.value
+)
+_OPERATION_SUCCESS_MASK = OperationStatus.COMPLETED.value | OperationStatus.SKIPPED.value
 
+# Classifications never change, so they are stored on each member once
+# and read as plain attributes instead of being recomputed per access
+for _status in OperationStatus:
+    _status.is_terminal = bool(_status.value & _OPERATION_TERMINAL_MASK)
+    _status.is_successful = bool(_status.value & _OPERATION_SUCCESS_MASK)
 
-class SessionStatus(Enum):
+
+class SessionStatus(_DisplayNameEnum):
     """
     Enumeration of possible states for a processing session.
     
@@ -80,51 +126,48 @@ class SessionStatus(Enum):
         COMPLETED: All operations finished successfully
         FAILED: Session failed due to critical error
         CANCELLED: Session was cancelled by user
-    """
-    INITIALIZING = auto()
-    SCANNING = auto()
-    READY = auto()
-    PROCESSING = auto()
-    PAUSED = auto()
-    COMPLETED = auto()
-    FAILED = auto()
-    CANCELLED = auto()
-    
-    def __str__(self) -> str:
-        """Return human-readable string representation."""
-        return self.name.replace('_', ' ').title()
-    
-    @property
-    def is_active(self) -> bool:
-        """Check if the session is currently active (can continue processing)."""
-        return self in {
-            SessionStatus.INITIALIZING,
-            SessionStatus.SCANNING,
-            SessionStatus.READY,
-            SessionStatus.PROCESSING,
-            SessionStatus.PAUSED
-        }
     
-    @property
-    def is_finished(self) -> bool:
-        """Check if the session has reached a terminal state."""
-        return self in {
-            SessionStatus.COMPLETED,
-            SessionStatus.FAILED,
-            SessionStatus.CANCELLED
-        }
-    
-    @property
-    def allows_new_operations(self) -> bool:
-        """Check if new operations can be added to the session."""
-        return self in {
-            SessionStatus.INITIALIZING,
-            SessionStatus.SCANNING,
-            SessionStatus.READY
-        }
+    Attributes:
+        is_active: True if the session can continue processing
+        is_finished: True if the session has reached a terminal state
+        allows_new_operations: True if new operations can be added to the session
+    """
+    INITIALIZING = 1
+    SCANNING = 2
+    READY = 4
+    PROCESSING = 8
+    PAUSED = 16
+    COMPLETED = 32
+    FAILED = 64
+    CANCELLED = 128
 
 
-class ValidationLevel(Enum):
+_SESSION_ACTIVE_MASK = (
+    SessionStatus.INITIALIZING.value
+    | SessionStatus.SCANNING.value
+    | SessionStatus.READY.value
+    | SessionStatus.PROCESSING.value
+    | SessionStatus.PAUSED.value
+)
+_SESSION_FINISHED_MASK = (
+    SessionStatus.COMPLETED.value
+    | SessionStatus.FAILED.value
+    | SessionStatus.CANCELLED.value
+)
+_SESSION_ALLOWS_NEW_MASK = (
+    SessionStatus.INITIALIZING.value
+    | SessionStatus.SCANNING.value
+    | SessionStatus.READY.value
+)
+
+for _status in SessionStatus:
+    _status.is_active = bool(_status.value & _SESSION_ACTIVE_MASK)
+    _status.is_finished = bool(_status.value & _SESSION_FINISHED_MASK)
+    _status.allows_new_operations = bool(_status.value & _SESSION_ALLOWS_NEW_MASK)
+del _status
+
+
+class ValidationLevel(_DisplayNameEnum):
     """
     Enumeration of validation strictness levels for file operations.
     
@@ -134,20 +177,19 @@ class ValidationLevel(Enum):
         PERMISSIVE: Minimal validation, allow most operations
         DISABLED: Skip validation entirely (not recommended)
     """
-    STRICT = auto()
-    NORMAL = auto()
-    PERMISSIVE = auto()
-    DISABLED = auto()
-    
-    def __str__(self) -> str:
-        """Return human-readable string representation."""
-        return self.name.title()
+    STRICT = 1
+    NORMAL = 2
+    PERMISSIVE = 3
+    DISABLED = 4
 
 
-class LogLevel(Enum):
+class LogLevel(int, _DisplayNameEnum):
     """
     Enumeration of logging levels for application debugging and monitoring.
     
+    Members are ints equal to the matching Python logging constants, so
+    they can be compared and passed to the logging module directly.
+    
     Values:
         DEBUG: Detailed information for diagnosing problems
         INFO: General information about application operation
@@ -155,29 +197,41 @@ class LogLevel(Enum):
         ERROR: Error messages for operation failures
         CRITICAL: Critical errors that may cause application shutdown
     """
-    DEBUG = auto()
-    INFO = auto()
-    WARNING = auto()
-    ERROR = auto()
-    CRITICAL = auto()
-    
-    def __str__(self) -> str:
-        """Return human-readable string representation."""
-        return self.name.title()
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    CRITICAL = 50
     
     @property
     def numeric_level(self) -> int:
         """Return numeric level compatible with Python logging module."""
-        level_mapping = {
-            LogLevel.DEBUG: 10,
-            LogLevel.INFO: 20,
-            LogLevel.WARNING: 30,
-            LogLevel.ERROR: 40,
-            LogLevel.CRITICAL: 50
-        }
-        return level_mapping[self]
+        return int(self)
 
 
+@_with_tables(
+    strftime_format={
+        'ISO_DATE': "%Y-%m-%d",
+        'US_DATE': "%m-%d-%Y",
+        'COMPACT': "%Y%m%d",
+        'DDMMYYYY': "%d%m%Y",
+        'YEAR_MONTH': "%Y-%m"
+    },
+    example={
+        'ISO_DATE': "2024-03-15",
+        'US_DATE': "03-15-2024",
+        'COMPACT': "20240315",
+        'DDMMYYYY': "15032024",
+        'YEAR_MONTH': "2024-03"
+    },
+    description={
+        'ISO_DATE': "ISO standard format (YYYY-MM-DD)",
+        'US_DATE': "US format (MM-DD-YYYY)",
+        'COMPACT': "Compact format (YYYYMMDD)",
+        'DDMMYYYY': "Day-first format (DDMMYYYY)",
+        'YEAR_MONTH': "Year and month only (YYYY-MM)"
+    },
+)
 class DateFormatStyle(Enum):
     """
     Enumeration of supported date prefix formatting styles.
@@ -188,6 +242,11 @@ class DateFormatStyle(Enum):
         COMPACT: YYYYMMDD format (no separators)
         DDMMYYYY: DDMMYYYY format (default)
         YEAR_MONTH: YYYY-MM format (day omitted)
+    
+    Attributes:
+        strftime_format: The corresponding strftime format string
+        example: An example of this format style
+        description: A human-readable description of this format style
     """
     ISO_DATE = "YYYY-MM-DD"
     US_DATE = "MM-DD-YYYY"
@@ -198,39 +257,26 @@ class DateFormatStyle(Enum):
     def __str__(self) -> str:
         """Return the format string."""
         return self.value
-    
-    @property
-    def strftime_format(self) -> str:
-        """Return the corresponding strftime format string."""
-        format_mapping = {
-            DateFormatStyle.ISO_DATE: "%Y-%m-%d",
-            DateFormatStyle.US_DATE: "%m-%d-%Y",
-            DateFormatStyle.COMPACT: "%Y%m%d",
-            DateFormatStyle.DDMMYYYY: "%d%m%Y",
-            DateFormatStyle.YEAR_MONTH: "%Y-%m"
-        }
-        return format_mapping[self]
-    
-    @property
-    def example(self) -> str:
-        """Return an example of this format style."""
-        examples = {
-            DateFormatStyle.ISO_DATE: "2024-03-15",
-            DateFormatStyle.US_DATE: "03-15-2024",
-            DateFormatStyle.COMPACT: "20240315",
-            DateFormatStyle.DDMMYYYY: "15032024",
-            DateFormatStyle.YEAR_MONTH: "2024-03"
-        }
-        return examples[self]
-    
-    @property
-    def description(self) -> str:
-        """Return a human-readable description of this format style."""
-        descriptions = {
-            DateFormatStyle.ISO_DATE: "ISO standard format (YYYY-MM-DD)",
-            DateFormatStyle.US_DATE: "US format (MM-DD-YYYY)",
-            DateFormatStyle.COMPACT: "Compact format (YYYYMMDD)",
-            DateFormatStyle.DDMMYYYY: "Day-first format (DDMMYYYY)",
-            DateFormatStyle.YEAR_MONTH: "Year and month only (YYYY-MM)"
-        }
-        return descriptions[self]
\ No newline at end of file
+
+
+# Read-only tables keyed by the user-facing format string (e.g. "YYYY-MM-DD"),
+# for callers that hold a preference string and never need the enum member
+STRFTIME_BY_VALUE = MappingProxyType({
+    style.value: fmt for style, fmt in DateFormatStyle._TABLE_strftime_format.items()
+})
+
+EXAMPLE_BY_VALUE = MappingProxyType({
+    style.value: example for style, example in DateFormatStyle._TABLE_example.items()
+})
+
+DESCRIPTION_BY_VALUE = MappingProxyType({
+    style.value: description for style, description in DateFormatStyle._TABLE_description.items()
+})
+
+
+# Module-level accessor for the date formatting hot path; a single cached
+# lookup instead of an attribute/property resolution on the member
+@functools.cache
+def strftime_format(style: DateFormatStyle) -> str:
+    """Return the strftime format string for a DateFormatStyle."""
+    return DateFormatStyle._TABLE_strftime_format[style]
@@ -5,8 +5,11 @@ This module defines application-specific exceptions to provide clear error
 handling and meaningful error messages for different failure scenarios.
 """
 
+import copyreg
+import errno
+from io import StringIO
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
 
 
 class DatePrefixRenamerError(Exception):
@@ -18,17 +21,26 @@ class DatePrefixRenamerError(Exception):
     
     Attributes:
         message: Human-readable error message
-        details: Additional context or technical details
+        details: Additional context or technical details. May be given as a
+            zero-argument callable, which is only called (once) when the
+            details are first read, e.g. when the error is logged
         error_code: Optional error code for programmatic handling
     """
     
-    def __init__(self, message: str, details: Optional[str] = None, error_code: Optional[str] = None):
+    __slots__ = ('message', '_details', 'error_code')
+    
+    # (attribute, label) pairs appended to the message by __str__ when set
+    _FIELDS: Tuple[Tuple[str, str], ...] = ()
+    
+    def __init__(self, message: str, details: Optional[Union[str, Callable[[], str]]] = None,
+                 error_code: Optional[str] = None):
         """
         Initialize the base exception.
         
         Args:
             message: Primary error message
-            details: Additional context or technical details
+            details: Additional context or technical details, or a callable
+                returning them
             error_code: Optional error code for programmatic handling
         """
         super().__init__(message)
@@ -36,11 +48,64 @@ class DatePrefixRenamerError(Exception):
         self.details = details
         self.error_code = error_code
     
+    @property
+    def details(self) -> Optional[str]:
+        """Additional context, rendered on first access if it was deferred."""
+        details = self._details
+        if callable(details):
+            details = self._details = details()
+        return details
+    
+    @details.setter
+    def details(self, value: Optional[Union[str, Callable[[], str]]]) -> None:
+        self._details = value
+    
+    def __reduce__(self):
+        """
+        Support copy and pickle for the slotted attributes.
+        
+        BaseException's own __reduce__ only carries args and __dict__, so the
+        slots of every class in the hierarchy are passed as state instead.
+        Deferred details are rendered first, since callables may not pickle.
+        
+        Returns:
+            Tuple rebuilding the error without re-running __init__
+        """
+        # Render deferred details so the state holds a string, not a callable
+        self._details = self.details
+        state = {}
+        for klass in type(self).__mro__:
+            for name in klass.__dict__.get('__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return copyreg.__newobj__, (type(self),) + self.args, state
+    
     def __str__(self) -> str:
-        """Return formatted error message."""
-        if self.details:
-            return f"{self.message} Details: {self.details}"
-        return self.message
+        """Return formatted error message with any context fields that are set."""
+        buf = StringIO()
+        self._format(buf)
+        return buf.getvalue()
+    
+    def _format(self, buf: StringIO) -> None:
+        """
+        Write the formatted error message to a buffer.
+        
+        Subclasses with context that does not fit _FIELDS override this.
+        
+        Args:
+            buf: Buffer receiving the " | "-separated message segments
+        """
+        write = buf.write
+        write(self.message)
+        for name, label in self._FIELDS:
+            value = getattr(self, name)
+            if value:
+                write(f" | {label}: {value}")
+        details = self.details
+        if details:
+            # Errors with context fields join every segment with " | "; the
+            # bare base error has always put a plain space before its details
+            write(f" | Details: {details}" if self._FIELDS else f" Details: {details}")
 
 
 class FileSystemError(DatePrefixRenamerError):
@@ -55,6 +120,10 @@ class FileSystemError(DatePrefixRenamerError):
         operation: The operation that was attempted
     """
     
+    __slots__ = ('path', 'operation')
+    
+    _FIELDS = (('path', 'Path'), ('operation', 'Operation'))
+    
     def __init__(self, message: str, path: Optional[Path] = None, 
                  operation: Optional[str] = None, **kwargs):
         """
@@ -69,27 +138,19 @@ class FileSystemError(DatePrefixRenamerError):
         super().__init__(message, **kwargs)
         self.path = path
         self.operation = operation
-    
-    def __str__(self) -> str:
-        """Return formatted error message with path context."""
-        parts = [self.message]
-        if self.path:
-            parts.append(f"Path: {self.path}")
-        if self.operation:
-            parts.append(f"Operation: {self.operation}")
-        if self.details:
-            parts.append(f"Details: {self.details}")
-        return " | ".join(parts)
-
-
-class FileNotFoundError(FileSystemError):
+
+
+class AppFileNotFoundError(FileSystemError):
     """
     Exception for when a required file or directory cannot be found.
     
     This exception is raised when the application attempts to access a file
-    or directory that does not exist.
+    or directory that does not exist. It is deliberately not named
+    FileNotFoundError so that importing it never shadows the builtin.
     """
     
+    __slots__ = ()
+    
     def __init__(self, path: Path, operation: str = "access", **kwargs):
         """
         Initialize file not found error.
@@ -102,16 +163,47 @@ class FileNotFoundError(FileSystemError):
         message = f"File or directory not found: {path}"
         super().__init__(message, path=path, operation=operation, 
                         error_code="FILE_NOT_FOUND", **kwargs)
+    
+    @classmethod
+    def _fast(cls, path: Path, operation: str = "access",
+              details: Optional[str] = None) -> 'AppFileNotFoundError':
+        """
+        Build the error by setting its slots directly.
+        
+        Skips the keyword-argument chain through the base initialisers, for
+        code that creates these errors in bulk.
+        
+        Args:
+            path: The path that was not found
+            operation: The operation that was attempted
+            details: Additional context or technical details
+            
+        Returns:
+            Initialized AppFileNotFoundError
+        """
+        self = cls.__new__(cls)
+        message = f"File or directory not found: {path}"
+        Exception.__init__(self, message)
+        self.message = message
+        self.details = details
+        self.error_code = "FILE_NOT_FOUND"
+        self.path = path
+        self.operation = operation
+        return self
 
 
-class PermissionError(FileSystemError):
+class AppPermissionError(FileSystemError):
     """
     Exception for permission-related filesystem errors.
     
     Raised when the application lacks necessary permissions to perform
     filesystem operations such as reading, writing, or renaming files.
+    It is deliberately not named PermissionError so that importing it never
+    shadows the builtin raised by the os module.
     """
     
+    __slots__ = ()
+    
     def __init__(self, path: Path, operation: str, required_permission: str = "read/write", **kwargs):
         """
         Initialize permission error.
@@ -120,12 +212,40 @@ class PermissionError(FileSystemError):
             path: The path that lacks permissions
             operation: The operation that was denied
             required_permission: Description of required permissions
-            **kwargs: Additional arguments for base class
+            **kwargs: Additional arguments for base class (an explicit
+                details value replaces the required-permission note)
         """
         message = f"Permission denied for {operation} on {path}"
-        details = f"Required permission: {required_permission}"
+        kwargs.setdefault('details', f"Required permission: {required_permission}")
         super().__init__(message, path=path, operation=operation, 
-                        details=details, error_code="PERMISSION_DENIED", **kwargs)
+                        error_code="PERMISSION_DENIED", **kwargs)
+    
+    @classmethod
+    def _fast(cls, path: Path, operation: str,
+              details: Optional[str] = None) -> 'AppPermissionError':
+        """
+        Build the error by setting its slots directly.
+        
+        Skips the keyword-argument chain through the base initialisers, for
+        code that creates these errors in bulk.
+        
+        Args:
+            path: The path that lacks permissions
+            operation: The operation that was denied
+            details: Additional context (default: required-permission note)
+            
+        Returns:
+            Initialized AppPermissionError
+        """
+        self = cls.__new__(cls)
+        message = f"Permission denied for {operation} on {path}"
+        Exception.__init__(self, message)
+        self.message = message
+        self.details = details if details is not None else "Required permission: read/write"
+        self.error_code = "PERMISSION_DENIED"
+        self.path = path
+        self.operation = operation
+        return self
 
 
 class DiskSpaceError(FileSystemError):
@@ -136,6 +256,8 @@ class DiskSpaceError(FileSystemError):
     disk space on the target volume.
     """
     
+    __slots__ = ()
+    
     def __init__(self, path: Path, required_space: Optional[int] = None, 
                  available_space: Optional[int] = None, **kwargs):
         """
@@ -145,20 +267,24 @@ class DiskSpaceError(FileSystemError):
             path: The path where space is needed
             required_space: Required space in bytes
             available_space: Available space in bytes
-            **kwargs: Additional arguments for base class
+            **kwargs: Additional arguments for base class (an explicit
+                details value replaces the space summary)
         """
         message = "Insufficient disk space for operation"
         
-        details_parts = []
-        if required_space:
-            details_parts.append(f"Required: {required_space:,} bytes")
-        if available_space:
-            details_parts.append(f"Available: {available_space:,} bytes")
+        # Formatted only if the details are actually read
+        def space_details() -> str:
+            details_parts = []
+            if required_space:
+                details_parts.append(f"Required: {required_space:,} bytes")
+            if available_space:
+                details_parts.append(f"Available: {available_space:,} bytes")
+            return " | ".join(details_parts)
         
-        details = " | ".join(details_parts) if details_parts else None
+        kwargs.setdefault('details', space_details if required_space or available_space else None)
         
         super().__init__(message, path=path, operation="write", 
-                        details=details, error_code="DISK_SPACE", **kwargs)
+                        error_code="DISK_SPACE", **kwargs)
 
 
 class ValidationError(DatePrefixRenamerError):
@@ -174,6 +300,10 @@ class ValidationError(DatePrefixRenamerError):
         constraint: Description of the violated constraint
     """
     
+    __slots__ = ('field', 'value', 'constraint')
+    
+    _FIELDS = (('field', 'Field'), ('value', 'Value'), ('constraint', 'Constraint'))
+    
     def __init__(self, message: str, field: Optional[str] = None, 
                  value: Optional[str] = None, constraint: Optional[str] = None, **kwargs):
         """
@@ -186,23 +316,11 @@ class ValidationError(DatePrefixRenamerError):
             constraint: Description of constraint that was violated
             **kwargs: Additional arguments for base class
         """
-        super().__init__(message, error_code="VALIDATION_FAILED", **kwargs)
+        kwargs.setdefault('error_code', "VALIDATION_FAILED")
+        super().__init__(message, **kwargs)
         self.field = field
         self.value = value
         self.constraint = constraint
-    
-    def __str__(self) -> str:
-        """Return formatted validation error message."""
-        parts = [self.message]
-        if self.field:
-            parts.append(f"Field: {self.field}")
-        if self.value:
-            parts.append(f"Value: {self.value}")
-        if self.constraint:
-            parts.append(f"Constraint: {self.constraint}")
-        if self.details:
-            parts.append(f"Details: {self.details}")
-        return " | ".join(parts)
 
 
 class InvalidFilenameError(ValidationError):
@@ -213,6 +331,8 @@ class InvalidFilenameError(ValidationError):
     forbidden characters, or exceeds length limits.
     """
     
+    __slots__ = ()
+    
     def __init__(self, filename: str, reason: str, **kwargs):
         """
         Initialize invalid filename error.
@@ -239,6 +359,10 @@ class DateExtractionError(DatePrefixRenamerError):
         date_source: The source of date information (creation_time, modification_time, etc.)
     """
     
+    __slots__ = ('path', 'date_source')
+    
+    _FIELDS = (('path', 'Path'), ('date_source', 'Date source'))
+    
     def __init__(self, message: str, path: Optional[Path] = None, 
                  date_source: Optional[str] = None, **kwargs):
         """
@@ -253,17 +377,6 @@ class DateExtractionError(DatePrefixRenamerError):
         super().__init__(message, error_code="DATE_EXTRACTION", **kwargs)
         self.path = path
         self.date_source = date_source
-    
-    def __str__(self) -> str:
-        """Return formatted date extraction error message."""
-        parts = [self.message]
-        if self.path:
-            parts.append(f"Path: {self.path}")
-        if self.date_source:
-            parts.append(f"Date source: {self.date_source}")
-        if self.details:
-            parts.append(f"Details: {self.details}")
-        return " | ".join(parts)
 
 
 class RenameOperationError(DatePrefixRenamerError):
@@ -279,6 +392,10 @@ class RenameOperationError(DatePrefixRenamerError):
         operation_id: Optional identifier for the failed operation
     """
     
+    __slots__ = ('source_path', 'target_path', 'operation_id')
+    
+    _FIELDS = (('source_path', 'Source'), ('target_path', 'Target'), ('operation_id', 'Operation'))
+    
     def __init__(self, message: str, source_path: Optional[Path] = None,
                  target_path: Optional[Path] = None, operation_id: Optional[str] = None, **kwargs):
         """
@@ -291,23 +408,11 @@ class RenameOperationError(DatePrefixRenamerError):
             operation_id: Operation identifier
             **kwargs: Additional arguments for base class
         """
-        super().__init__(message, error_code="RENAME_FAILED", **kwargs)
+        kwargs.setdefault('error_code', "RENAME_FAILED")
+        super().__init__(message, **kwargs)
         self.source_path = source_path
         self.target_path = target_path
         self.operation_id = operation_id
-    
-    def __str__(self) -> str:
-        """Return formatted rename operation error message."""
-        parts = [self.message]
-        if self.source_path:
-            parts.append(f"Source: {self.source_path}")
-        if self.target_path:
-            parts.append(f"Target: {self.target_path}")
-        if self.operation_id:
-            parts.append(f"Operation: {self.operation_id}")
-        if self.details:
-            parts.append(f"Details: {self.details}")
-        return " | ".join(parts)
 
 
 class FileConflictError(RenameOperationError):
@@ -316,8 +421,14 @@ class FileConflictError(RenameOperationError):
     
     Raised when a rename operation would create a naming conflict
     with an existing file or directory.
+    
+    Attributes:
+        target_name: Final component of target_path, kept so reporting code
+            does not have to re-derive it from the path
     """
     
+    __slots__ = ('target_name',)
+    
     def __init__(self, source_path: Path, target_path: Path, 
                  conflict_type: str = "file_exists", **kwargs):
         """
@@ -329,10 +440,12 @@ class FileConflictError(RenameOperationError):
             conflict_type: Type of conflict (file_exists, case_conflict, etc.)
             **kwargs: Additional arguments for base class
         """
-        message = f"File conflict: {target_path.name} already exists"
+        target_name = target_path.name
+        message = f"File conflict: {target_name} already exists"
         details = f"Conflict type: {conflict_type}"
         super().__init__(message, source_path=source_path, target_path=target_path,
                         details=details, error_code="FILE_CONFLICT", **kwargs)
+        self.target_name = target_name
 
 
 class ProcessingSessionError(DatePrefixRenamerError):
@@ -347,6 +460,10 @@ class ProcessingSessionError(DatePrefixRenamerError):
         session_state: Current state of the session
     """
     
+    __slots__ = ('session_id', 'session_state')
+    
+    _FIELDS = (('session_id', 'Session'), ('session_state', 'State'))
+    
     def __init__(self, message: str, session_id: Optional[str] = None,
                  session_state: Optional[str] = None, **kwargs):
         """
@@ -361,17 +478,10 @@ class ProcessingSessionError(DatePrefixRenamerError):
         super().__init__(message, error_code="SESSION_ERROR", **kwargs)
         self.session_id = session_id
         self.session_state = session_state
-    
-    def __str__(self) -> str:
-        """Return formatted session error message."""
-        parts = [self.message]
-        if self.session_id:
-            parts.append(f"Session: {self.session_id}")
-        if self.session_state:
-            parts.append(f"State: {self.session_state}")
-        if self.details:
-            parts.append(f"Details: {self.details}")
-        return " | ".join(parts)
+
+
+# Shared read-only default for BatchOperationError's operation sequences
+_EMPTY_OPERATIONS: Tuple[str, ...] = ()
 
 
 class BatchOperationError(DatePrefixRenamerError):
@@ -382,40 +492,46 @@ class BatchOperationError(DatePrefixRenamerError):
     affect multiple files or require rollback operations.
     
     Attributes:
-        failed_operations: List of operations that failed
-        completed_operations: List of operations that succeeded before failure
+        failed_operations: Sequence of operations that failed
+        completed_operations: Sequence of operations that succeeded before failure
         rollback_possible: Whether the batch can be rolled back
+    
+    When no operations are given, both attributes share one empty tuple
+    rather than allocating a new list per error.
     """
     
-    def __init__(self, message: str, failed_operations: Optional[List[str]] = None,
-                 completed_operations: Optional[List[str]] = None, 
+    __slots__ = ('failed_operations', 'completed_operations', 'rollback_possible')
+    
+    def __init__(self, message: str, failed_operations: Optional[Sequence[str]] = None,
+                 completed_operations: Optional[Sequence[str]] = None, 
                  rollback_possible: bool = False, **kwargs):
         """
         Initialize batch operation error.
         
         Args:
             message: Error message
-            failed_operations: List of failed operation identifiers
-            completed_operations: List of completed operation identifiers
+            failed_operations: Sequence of failed operation identifiers
+            completed_operations: Sequence of completed operation identifiers
             rollback_possible: Whether rollback is possible
             **kwargs: Additional arguments for base class
         """
         super().__init__(message, error_code="BATCH_ERROR", **kwargs)
-        self.failed_operations = failed_operations or []
-        self.completed_operations = completed_operations or []
+        self.failed_operations = failed_operations or _EMPTY_OPERATIONS
+        self.completed_operations = completed_operations or _EMPTY_OPERATIONS
         self.rollback_possible = rollback_possible
     
-    def __str__(self) -> str:
-        """Return formatted batch operation error message."""
-        parts = [self.message]
+    def _format(self, buf: StringIO) -> None:
+        """Write the formatted batch operation error message to a buffer."""
+        write = buf.write
+        write(self.message)
         if self.failed_operations:
-            parts.append(f"Failed: {len(self.failed_operations)} operations")
+            write(f" | Failed: {len(self.failed_operations)} operations")
         if self.completed_operations:
-            parts.append(f"Completed: {len(self.completed_operations)} operations")
-        parts.append(f"Rollback possible: {self.rollback_possible}")
-        if self.details:
-            parts.append(f"Details: {self.details}")
-        return " | ".join(parts)
+            write(f" | Completed: {len(self.completed_operations)} operations")
+        write(f" | Rollback possible: {self.rollback_possible}")
+        details = self.details
+        if details:
+            write(f" | Details: {details}")
 
 
 class ConfigurationError(DatePrefixRenamerError):
@@ -430,6 +546,10 @@ class ConfigurationError(DatePrefixRenamerError):
         config_value: The invalid configuration value
     """
     
+    __slots__ = ('config_key', 'config_value')
+    
+    _FIELDS = (('config_key', 'Key'), ('config_value', 'Value'))
+    
     def __init__(self, message: str, config_key: Optional[str] = None,
                  config_value: Optional[str] = None, **kwargs):
         """
@@ -444,17 +564,39 @@ class ConfigurationError(DatePrefixRenamerError):
         super().__init__(message, error_code="CONFIG_ERROR", **kwargs)
         self.config_key = config_key
         self.config_value = config_value
-    
-    def __str__(self) -> str:
-        """Return formatted configuration error message."""
-        parts = [self.message]
-        if self.config_key:
-            parts.append(f"Key: {self.config_key}")
-        if self.config_value:
-            parts.append(f"Value: {self.config_value}")
-        if self.details:
-            parts.append(f"Details: {self.details}")
-        return " | ".join(parts)
+
+
+# Message fragments used to classify errors by their text (POSIX and Windows wording)
+_NOT_FOUND_PATTERNS = ("No such file or directory", "cannot find the path")
+_PERMISSION_PATTERNS = ("Permission denied", "Access is denied")
+_DISK_SPACE_PATTERNS = ("No space left", "disk full")
+
+
+def _not_found_error(operation: str, path: Path, error_message: str) -> FileSystemError:
+    return AppFileNotFoundError._fast(path, operation, error_message)
+
+
+def _permission_error(operation: str, path: Path, error_message: str) -> FileSystemError:
+    return AppPermissionError._fast(path, operation, error_message)
+
+
+def _disk_space_error(operation: str, path: Path, error_message: str) -> FileSystemError:
+    return DiskSpaceError(path, details=error_message)
+
+
+def _generic_filesystem_error(operation: str, path: Path, error_message: str) -> FileSystemError:
+    return FileSystemError(f"Filesystem error during {operation}", 
+                         path=path, operation=operation, details=error_message)
+
+
+# OSError.errno values are locale-independent (Windows errors are mapped onto
+# the same codes), so they are the primary way to classify an error
+_ERRNO_DISPATCH: Dict[int, Callable[[str, Path, str], FileSystemError]] = {
+    errno.ENOENT: _not_found_error,
+    errno.EACCES: _permission_error,
+    errno.EPERM: _permission_error,
+    errno.ENOSPC: _disk_space_error,
+}
 
 
 # Convenience function for error handling
@@ -472,12 +614,18 @@ def handle_filesystem_error(operation: str, path: Path, original_error: Exceptio
     """
     error_message = str(original_error)
     
-    if "No such file or directory" in error_message or "cannot find the path" in error_message:
-        return FileNotFoundError(path, operation, details=error_message)
-    elif "Permission denied" in error_message or "Access is denied" in error_message:
-        return PermissionError(path, operation, details=error_message)
-    elif "No space left" in error_message or "disk full" in error_message:
-        return DiskSpaceError(path, details=error_message)
+    if isinstance(original_error, OSError) and original_error.errno is not None:
+        factory = _ERRNO_DISPATCH.get(original_error.errno, _generic_filesystem_error)
+        return factory(operation, path, error_message)
+    
+    # Errors without an errno can only be classified by their message text
+    contains = error_message.__contains__
+    if any(map(contains, _NOT_FOUND_PATTERNS)):
+        factory = _not_found_error
+    elif any(map(contains, _PERMISSION_PATTERNS)):
+        factory = _permission_error
+    elif any(map(contains, _DISK_SPACE_PATTERNS)):
+        factory = _disk_space_error
     else:
-        return FileSystemError(f"Filesystem error during {operation}", 
-                             path=path, operation=operation, details=error_message)
\ No newline at end of file
+        factory = _generic_filesystem_error
+    return factory(operation, path, error_message)
\ No newline at end of file
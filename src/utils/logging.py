@@ -5,22 +5,124 @@ This module provides centralized logging setup, custom formatters, and
 operation tracking capabilities for debugging and monitoring application behavior.
 """
 
+import atexit
+import itertools
 import logging
 import logging.handlers
+import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Any, TextIO
+from typing import Any, Callable, Dict, Optional, TextIO
 
 from ..models.enums import LogLevel
 
 
+def _read_max_log_level() -> int:
+    """
+    Read the compile-time style log level floor from the environment.
+    
+    Returns:
+        Numeric level from RENAMER_MAX_LOG_LEVEL (number or level name),
+        or logging.DEBUG if unset or unrecognised
+    """
+    value = os.environ.get("RENAMER_MAX_LOG_LEVEL", "").strip()
+    if not value:
+        return logging.DEBUG
+    if value.isdigit():
+        return int(value)
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else logging.DEBUG
+
+
+# Lowest level the OperationLogger convenience methods will emit. Fixed at
+# import time, unlike setLevel(): calls below it return before any logging
+# machinery runs, so it can only be raised by restarting the process.
+_MAX_LOG_LEVEL = _read_max_log_level()
+
+
+# Upper-cased operation names for log_file_operation; the set of operation
+# names is small and fixed, so each is upper-cased and interned only once
+_UPPER_CACHE: Dict[str, str] = {}
+
+
+def _upper(text: str) -> str:
+    """Return text.upper(), cached and interned."""
+    cached = _UPPER_CACHE.get(text)
+    if cached is None:
+        cached = _UPPER_CACHE[text] = sys.intern(text.upper())
+    return cached
+
+
+# Background listener that drains the logging queue into the real handlers;
+# replaced by each setup_logging() call and stopped at interpreter exit
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the active queue listener, if any."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class _ContextArgs:
+    """
+    Deferred "key=value | ..." rendering of extra log context.
+    
+    Passed as a %-style argument so the join only happens if a handler
+    actually formats the record.
+    """
+    
+    __slots__ = ('context',)
+    
+    def __init__(self, context: Dict[str, Any]):
+        self.context = context
+    
+    def __str__(self) -> str:
+        return " | ".join(f"{k}={v}" for k, v in self.context.items())
+
+
+# Fallbacks for records that never passed through _OperationContextFilter
+_OPERATION_FIELD_DEFAULTS = {'operation_prefix': '', 'duration_suffix': ''}
+
+
+class _OperationContextFilter(logging.Filter):
+    """
+    Render operation_id and duration_ms into ready-to-format record fields.
+    
+    Sets operation_prefix ("[id] " or "") and duration_suffix
+    (" (took N.Nms)" or "") so OperationFormatter needs no format() override.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        operation_id = getattr(record, 'operation_id', None)
+        record.operation_prefix = f"[{operation_id}] " if operation_id else ""
+        
+        duration_ms = getattr(record, 'duration_ms', None)
+        record.duration_suffix = f" (took {duration_ms:.1f}ms)" if duration_ms is not None else ""
+        return True
+
+
+_OPERATION_CONTEXT_FILTER = _OperationContextFilter()
+
+
 class OperationFormatter(logging.Formatter):
     """
     Custom formatter for operation tracking with structured output.
     
     This formatter provides consistent, structured log messages that include
-    operation context, timing information, and relevant metadata.
+    operation context, timing information, and relevant metadata. The
+    operation and timing fields are prepared by _OperationContextFilter, so
+    the whole record is rendered by the base Formatter in one pass.
     """
     
     def __init__(self, include_thread: bool = False, include_process: bool = False):
@@ -46,37 +148,78 @@ class OperationFormatter(logging.Formatter):
         
         format_parts.extend([
             "%(funcName)s:%(lineno)d",
-            "%(message)s"
+            "%(operation_prefix)s%(message)s%(duration_suffix)s"
         ])
         
         format_string = " | ".join(format_parts)
         
         super().__init__(
             fmt=format_string,
-            datefmt="%Y-%m-%d %H:%M:%S"
+            datefmt="%Y-%m-%d %H:%M:%S",
+            defaults=_OPERATION_FIELD_DEFAULTS
         )
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that batches low-severity records in the write buffer.
+    
+    The stock handler flushes after every record (one write() per line), and
+    its size check seeks the file, which forces a flush as well. This handler
+    tracks the file size itself and flushes only for records at or above
+    flush_level; other records reach the disk when the buffer fills, the file
+    rotates, or the handler is closed at shutdown.
+    """
     
-    def format(self, record: logging.LogRecord) -> str:
+    def __init__(self, *args, buffer_size: int = 64 * 1024,
+                 flush_level: int = logging.WARNING, **kwargs):
         """
-        Format a log record with additional context.
+        Initialize the buffered rotating file handler.
         
         Args:
-            record: The log record to format
-            
-        Returns:
-            Formatted log message string
+            *args: Positional arguments for RotatingFileHandler
+            buffer_size: Size in bytes of the file write buffer
+            flush_level: Minimum record level that is flushed immediately
+            **kwargs: Keyword arguments for RotatingFileHandler
         """
-        # Add custom fields if present
-        if hasattr(record, 'operation_id'):
-            record.message = f"[{record.operation_id}] {record.getMessage()}"
-        else:
-            record.message = record.getMessage()
-        
-        # Add duration if present
-        if hasattr(record, 'duration_ms'):
-            record.message += f" (took {record.duration_ms:.1f}ms)"
-        
-        return super().format(record)
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._size = 0
+        super().__init__(*args, **kwargs)
+    
+    def _open(self) -> TextIO:
+        """Open the log file with a large write buffer and note its current size."""
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.seek(0, 2)
+        return stream
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Check the tracked file size instead of seeking the stream."""
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            return self._size + len(self.format(record)) + 1 >= self.maxBytes
+        return False
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only if it is at or above flush_level."""
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._size += len(msg) if msg.isascii() else len(msg.encode(self.encoding or 'utf-8', 'replace'))
+            
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class OperationLogger:
@@ -89,7 +232,7 @@ class OperationLogger:
     Attributes:
         logger: Underlying Python logger instance
         operation_id: Current operation identifier for context
-        start_time: Start time for duration tracking
+        _start_ns: perf_counter_ns() reading at operation start, for duration tracking
     """
     
     def __init__(self, name: str, operation_id: Optional[str] = None):
@@ -102,7 +245,7 @@ class OperationLogger:
         """
         self.logger = logging.getLogger(name)
         self.operation_id = operation_id
-        self.start_time: Optional[datetime] = None
+        self._start_ns: Optional[int] = None
     
     def start_operation(self, operation_id: str, description: str, **kwargs):
         """
@@ -114,14 +257,19 @@ class OperationLogger:
             **kwargs: Additional context to include
         """
         self.operation_id = operation_id
-        self.start_time = datetime.now()
+        self._start_ns = time.perf_counter_ns()
         
-        context = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-        message = f"Starting: {description}"
-        if context:
-            message += f" | {context}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        self._log_with_context(logging.INFO, message)
+        message = "Starting: %s"
+        args = [description]
+        
+        if kwargs:
+            message += " | %s"
+            args.append(_ContextArgs(kwargs))
+        
+        self._log_with_context(logging.INFO, message, *args)
     
     def end_operation(self, success: bool = True, result: Optional[str] = None, **kwargs):
         """
@@ -132,27 +280,30 @@ class OperationLogger:
             result: Optional result description
             **kwargs: Additional context to include
         """
-        if self.start_time:
-            duration_ms = (datetime.now() - self.start_time).total_seconds() * 1000
-        else:
-            duration_ms = 0
-        
-        status = "Completed" if success else "Failed"
-        message = f"{status}: {self.operation_id or 'operation'}"
-        
-        if result:
-            message += f" | Result: {result}"
-        
-        context = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-        if context:
-            message += f" | {context}"
-        
         level = logging.INFO if success else logging.ERROR
-        self._log_with_context(level, message, duration_ms=duration_ms)
+        
+        if self.logger.isEnabledFor(level):
+            if self._start_ns is not None:
+                duration_ms = (time.perf_counter_ns() - self._start_ns) / 1_000_000
+            else:
+                duration_ms = 0
+            
+            message = "%s: %s"
+            args = ["Completed" if success else "Failed", self.operation_id or 'operation']
+            
+            if result:
+                message += " | Result: %s"
+                args.append(result)
+            
+            if kwargs:
+                message += " | %s"
+                args.append(_ContextArgs(kwargs))
+            
+            self._log_with_context(level, message, *args, duration_ms=duration_ms)
         
         # Reset operation context
         self.operation_id = None
-        self.start_time = None
+        self._start_ns = None
     
     def log_file_operation(self, operation: str, file_path: Path, success: bool = True, 
                           error: Optional[str] = None, **kwargs):
@@ -166,18 +317,22 @@ class OperationLogger:
             error: Error message if operation failed
             **kwargs: Additional context
         """
-        status = "SUCCESS" if success else "FAILED"
-        message = f"{operation.upper()}: {file_path.name} [{status}]"
+        level = logging.INFO if success else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        message = "%s: %s [%s]"
+        args = [_upper(operation), file_path.name, "SUCCESS" if success else "FAILED"]
         
         if error:
-            message += f" | Error: {error}"
+            message += " | Error: %s"
+            args.append(error)
         
-        context = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
-        if context:
-            message += f" | {context}"
+        if kwargs:
+            message += " | %s"
+            args.append(_ContextArgs(kwargs))
         
-        level = logging.INFO if success else logging.ERROR
-        self._log_with_context(level, message, file_path=str(file_path))
+        self._log_with_context(level, message, *args, file_path=str(file_path))
     
     def log_batch_progress(self, completed: int, total: int, current_file: Optional[str] = None):
         """
@@ -188,13 +343,18 @@ class OperationLogger:
             total: Total number of operations
             current_file: Currently processing file name
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         percentage = (completed / total * 100) if total > 0 else 0
-        message = f"Progress: {completed}/{total} ({percentage:.1f}%)"
+        message = "Progress: %s/%s (%.1f%%)"
+        args = [completed, total, percentage]
         
         if current_file:
-            message += f" | Processing: {current_file}"
+            message += " | Processing: %s"
+            args.append(current_file)
         
-        self._log_with_context(logging.INFO, message)
+        self._log_with_context(logging.INFO, message, *args)
     
     def log_validation_result(self, item_name: str, valid: bool, reason: Optional[str] = None):
         """
@@ -205,41 +365,52 @@ class OperationLogger:
             valid: Whether validation passed
             reason: Reason for validation failure
         """
-        status = "VALID" if valid else "INVALID"
-        message = f"Validation: {item_name} [{status}]"
+        level = logging.DEBUG if valid else logging.WARNING
+        if not self.logger.isEnabledFor(level):
+            return
+        
+        message = "Validation: %s [%s]"
+        args = [item_name, "VALID" if valid else "INVALID"]
         
         if reason:
-            message += f" | Reason: {reason}"
+            message += " | Reason: %s"
+            args.append(reason)
         
-        level = logging.DEBUG if valid else logging.WARNING
-        self._log_with_context(level, message)
+        self._log_with_context(level, message, *args)
     
-    def _log_with_context(self, level: int, message: str, **extra):
+    def _log_with_context(self, level: int, message: str, *args, **extra):
         """
         Log a message with operation context.
         
         Args:
             level: Logging level
-            message: Log message
+            message: Log message, optionally with %-style placeholders
+            *args: Values for the placeholders, merged only if the record is emitted
             **extra: Additional fields to include in log record
         """
         # Add operation context if available
         if self.operation_id:
             extra['operation_id'] = self.operation_id
         
-        self.logger.log(level, message, extra=extra)
+        self.logger.log(level, message, *args, extra=extra)
     
     # Convenience methods for different log levels
     def debug(self, message: str, **kwargs):
         """Log a debug message."""
+        if _MAX_LOG_LEVEL > logging.DEBUG:
+            return
         self._log_with_context(logging.DEBUG, message, **kwargs)
     
     def info(self, message: str, **kwargs):
         """Log an info message."""
+        if _MAX_LOG_LEVEL > logging.INFO:
+            return
         self._log_with_context(logging.INFO, message, **kwargs)
     
     def warning(self, message: str, **kwargs):
         """Log a warning message."""
+        if _MAX_LOG_LEVEL > logging.WARNING:
+            return
         self._log_with_context(logging.WARNING, message, **kwargs)
     
     def error(self, message: str, **kwargs):
@@ -251,6 +422,23 @@ class OperationLogger:
         self._log_with_context(logging.CRITICAL, message, **kwargs)
 
 
+@dataclass(slots=True)
+class LoggingHandlers:
+    """
+    Handlers configured by setup_logging().
+    
+    Attributes:
+        console: Console output handler, if console output is enabled
+        file: Rotating log file handler, if a log file was given
+        queue: QueueHandler attached to the root logger
+        listener: QueueListener feeding the console and file handlers
+    """
+    console: Optional[logging.Handler] = None
+    file: Optional[logging.Handler] = None
+    queue: Optional[logging.handlers.QueueHandler] = None
+    listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(
     level: LogLevel = LogLevel.INFO,
     log_file: Optional[Path] = None,
@@ -259,10 +447,15 @@ def setup_logging(
     backup_count: int = 5,
     include_thread_info: bool = False,
     include_process_info: bool = False
-) -> Dict[str, logging.Handler]:
+) -> LoggingHandlers:
     """
     Configure application-wide logging with file and console handlers.
     
+    The console and file handlers are not attached to the root logger
+    directly. The root logger gets a QueueHandler, and a QueueListener
+    thread feeds the records to the real handlers, so logging calls on the
+    scan/rename path never block on terminal or disk I/O.
+    
     Args:
         level: Minimum logging level
         log_file: Path to log file (optional)
@@ -273,7 +466,7 @@ def setup_logging(
         include_process_info: Include process information in logs
         
     Returns:
-        Dictionary of configured handlers by name
+        LoggingHandlers with the configured handlers and queue listener
     """
     # Convert LogLevel to Python logging level
     py_level = level.numeric_level
@@ -288,25 +481,27 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(py_level)
     
-    # Clear any existing handlers
+    # Clear any existing handlers and drain the previous queue
     root_logger.handlers.clear()
+    _stop_queue_listener()
     
-    handlers = {}
+    handlers = LoggingHandlers()
     
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(py_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
-        handlers['console'] = console_handler
+        console_handler.addFilter(_OPERATION_CONTEXT_FILTER)
+        handlers.console = console_handler
     
     # File handler with rotation
     if log_file:
         # Ensure log directory exists
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.handlers.RotatingFileHandler(
+        # Buffered so routine records don't cost a write() each
+        file_handler = BufferedRotatingFileHandler(
             filename=log_file,
             maxBytes=max_file_size,
             backupCount=backup_count,
@@ -314,8 +509,24 @@ def setup_logging(
         )
         file_handler.setLevel(py_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-        handlers['file'] = file_handler
+        file_handler.addFilter(_OPERATION_CONTEXT_FILTER)
+        handlers.file = file_handler
+    
+    output_handlers = [h for h in (handlers.console, handlers.file) if h is not None]
+    if output_handlers:
+        global _queue_listener
+        
+        # Level filtering happens when a record is queued, so a later
+        # set_log_level() cannot drop records that are already waiting
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(py_level)
+        root_logger.addHandler(queue_handler)
+        
+        _queue_listener = logging.handlers.QueueListener(log_queue, *output_handlers)
+        _queue_listener.start()
+        handlers.queue = queue_handler
+        handlers.listener = _queue_listener
     
     return handlers
 
@@ -334,33 +545,119 @@ def get_operation_logger(name: str, operation_id: Optional[str] = None) -> Opera
     return OperationLogger(name, operation_id)
 
 
-def configure_logger_for_gui(log_widget_callback: Optional[callable] = None) -> logging.Handler:
+def configure_logger_for_gui(log_widget_callback: Optional[callable] = None,
+                             scheduler: Optional[Callable[[int, Callable[[], None]], object]] = None
+                             ) -> logging.Handler:
     """
     Configure logging for GUI applications with optional widget output.
     
+    Records are queued and handed to the callback in batches, one call per
+    run of same-level messages, so logging never blocks on the widget.
+    
     Args:
         log_widget_callback: Optional callback function for sending logs to GUI widget
+        scheduler: Optional UI-thread scheduler such as Tk's ``root.after``.
+            When given, the queue is drained by a poll that the scheduler runs
+            on the UI thread, so the callback may write to widgets directly;
+            call this and close the handler from that thread. Without it the
+            callback runs on a background worker thread and must marshal any
+            widget updates onto the UI thread itself
         
     Returns:
         GUI-specific log handler
     """
     if log_widget_callback:
-        # Create custom handler that sends to GUI widget
         class GUILogHandler(logging.Handler):
-            def __init__(self, callback):
+            _BATCH_SIZE = 64
+            _POLL_INTERVAL_MS = 50
+            _STOP = object()
+            
+            def __init__(self, callback, scheduler):
                 super().__init__()
                 self.callback = callback
+                self._scheduler = scheduler
+                self._closed = False
+                self._queue = queue.SimpleQueue()
+                if scheduler is not None:
+                    self._worker = None
+                    scheduler(self._POLL_INTERVAL_MS, self._poll)
+                else:
+                    self._worker = threading.Thread(
+                        target=self._deliver, name="GUILogHandler", daemon=True
+                    )
+                    self._worker.start()
             
             def emit(self, record):
                 try:
-                    message = self.format(record)
-                    self.callback(message, record.levelname)
+                    self._queue.put((self.format(record), record.levelname))
                 except Exception:
                     # Prevent logging errors from crashing the application
                     pass
-        
-        gui_handler = GUILogHandler(log_widget_callback)
+            
+            def _take_batch(self, first):
+                batch = [first]
+                while len(batch) < self._BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                return batch
+            
+            def _send(self, batch):
+                # Join consecutive messages that share a level
+                start = 0
+                for end in range(1, len(batch) + 1):
+                    if end == len(batch) or batch[end][1] != batch[start][1]:
+                        try:
+                            self.callback(
+                                "\n".join(message for message, _ in batch[start:end]),
+                                batch[start][1]
+                            )
+                        except Exception:
+                            pass
+                        start = end
+            
+            def _drain(self):
+                while True:
+                    try:
+                        first = self._queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    self._send(self._take_batch(first))
+            
+            def _poll(self):
+                # Runs on the UI thread via the scheduler
+                self._drain()
+                if not self._closed:
+                    self._scheduler(self._POLL_INTERVAL_MS, self._poll)
+            
+            def _deliver(self):
+                # Worker thread loop, used when there is no scheduler
+                while True:
+                    batch = self._take_batch(self._queue.get())
+                    
+                    stop = self._STOP in batch
+                    if stop:
+                        batch = batch[:batch.index(self._STOP)]
+                    
+                    self._send(batch)
+                    
+                    if stop:
+                        return
+            
+            def close(self):
+                # Deliver everything queued so far before shutting down
+                self._closed = True
+                if self._worker is None:
+                    self._drain()
+                elif self._worker.is_alive():
+                    self._queue.put(self._STOP)
+                    self._worker.join()
+                super().close()
+        
+        gui_handler = GUILogHandler(log_widget_callback, scheduler)
         gui_handler.setFormatter(OperationFormatter())
+        gui_handler.addFilter(_OPERATION_CONTEXT_FILTER)
         
         # Add to root logger
         logging.getLogger().addHandler(gui_handler)
@@ -382,11 +679,20 @@ def set_log_level(level: LogLevel):
     # Update root logger
     logging.getLogger().setLevel(py_level)
     
-    # Update all handlers
-    for handler in logging.getLogger().handlers:
+    # Update all handlers, including those fed by the queue listener
+    handlers = list(logging.getLogger().handlers)
+    if _queue_listener is not None:
+        handlers.extend(_queue_listener.handlers)
+    
+    for handler in handlers:
         handler.setLevel(py_level)
 
 
+# Per-process operation ID sequence and the last (epoch second, "HHMMSS") pair
+_context_counter = itertools.count()
+_context_timestamp = (-1, "")
+
+
 def create_operation_context(operation_type: str, target_path: Optional[Path] = None) -> str:
     """
     Create a unique operation identifier for tracking.
@@ -398,17 +704,26 @@ def create_operation_context(operation_type: str, target_path: Optional[Path] =
     Returns:
         Unique operation identifier
     """
-    timestamp = datetime.now().strftime("%H%M%S")
+    global _context_timestamp
+    
+    # Format the wall-clock part at most once per second
+    now = int(time.time())
+    if _context_timestamp[0] != now:
+        _context_timestamp = (now, time.strftime("%H%M%S", time.localtime(now)))
+    timestamp = _context_timestamp[1]
+    
+    # Sequence suffix keeps IDs created within the same second distinct
+    sequence = next(_context_counter)
     
     if target_path:
         path_part = target_path.name[:10]  # First 10 chars of filename
-        return f"{operation_type}_{path_part}_{timestamp}"
+        return f"{operation_type}_{path_part}_{timestamp}_{sequence:x}"
     else:
-        return f"{operation_type}_{timestamp}"
+        return f"{operation_type}_{timestamp}_{sequence:x}"
 
 
 # Default logging configuration for the application
-def initialize_default_logging(log_directory: Optional[Path] = None) -> Dict[str, logging.Handler]:
+def initialize_default_logging(log_directory: Optional[Path] = None) -> LoggingHandlers:
     """
     Initialize logging with sensible defaults for the application.
     
@@ -416,7 +731,7 @@ def initialize_default_logging(log_directory: Optional[Path] = None) -> Dict[str
         log_directory: Directory for log files (optional)
         
     Returns:
-        Dictionary of configured handlers
+        LoggingHandlers with the configured handlers
     """
     log_file = None
     if log_directory:
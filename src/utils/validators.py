@@ -6,15 +6,24 @@ file renaming operations, including prefix detection, name generation, and
 target name validation.
 """
 
+import os
+import platform
 import re
+import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from ..models.enums import DateFormatStyle, ValidationLevel
 from ..core.date_extractor import DateExtractor
 
 
+# Windows and macOS (APFS/HFS+ by default) are case-insensitive; Linux is not.
+# Determined once at import since it cannot change while the process runs.
+_CASE_INSENSITIVE_PLATFORM = platform.system().lower() in ('windows', 'darwin')
+
+
 class ValidationError(Exception):
     """Raised when validation fails for file naming operations."""
     pass
@@ -67,6 +76,22 @@ class PrefixValidator(PrefixValidatorInterface):
         r'\s+$',                  # Trailing whitespace
     ]
     
+    # Windows device names that cannot be used as a file stem
+    RESERVED_NAMES = frozenset({
+        'CON', 'PRN', 'AUX', 'NUL',
+        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+    })
+    
+    # Single scan for platform problems: a reserved device name as the stem
+    # (optionally followed by one extension, matching Path.stem) or any
+    # control/Windows-problematic character anywhere in the name
+    _PLATFORM_INCOMPATIBLE_REGEX = re.compile(
+        r'^(?:' + '|'.join(sorted(RESERVED_NAMES)) + r')(?:\.[^.]+)?\Z'
+        r'|[\x00-\x1f<>:"|?*]',
+        re.IGNORECASE
+    )
+    
     # Maximum filename lengths for different filesystems
     MAX_FILENAME_LENGTHS = {
         'ntfs': 255,      # Windows NTFS
@@ -92,13 +117,32 @@ class PrefixValidator(PrefixValidatorInterface):
         """
         self.validation_level = validation_level
         self.date_extractor = date_extractor or DateExtractor()
-        self.allowed_extensions = set(allowed_extensions or [])
+        # Lowercased to match Path.suffix.lower(); interned since the same few
+        # extensions are compared against every candidate name
+        self.allowed_extensions = {sys.intern(ext.lower()) for ext in (allowed_extensions or [])}
         self.max_filename_length = max_filename_length
         
         # Compile forbidden patterns for efficiency
         self.forbidden_regexes = [
             re.compile(pattern, re.IGNORECASE) for pattern in self.FORBIDDEN_PATTERNS
         ]
+        
+        # One alternation per validation level so a name is scanned once;
+        # NORMAL checks the basic patterns, STRICT checks all of them
+        basic_regex = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.FORBIDDEN_PATTERNS[:4]), re.IGNORECASE
+        )
+        strict_regex = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.FORBIDDEN_PATTERNS), re.IGNORECASE
+        )
+        self._forbidden_regex_by_level = {
+            ValidationLevel.NORMAL: basic_regex,
+            ValidationLevel.STRICT: strict_regex,
+        }
+        
+        # Directory listings (lowercased name -> actual names), only populated
+        # for the duration of validate_batch_operations
+        self._dir_cache: Dict[Path, Dict[str, Set[str]]] = {}
     
     def has_date_prefix(self, filename: str) -> bool:
         """
@@ -142,13 +186,16 @@ class PrefixValidator(PrefixValidatorInterface):
         if not self._validate_filename_structure(target_name):
             raise ValidationError(f"Generated filename is invalid: {target_name}")
         
+        # Split once; truncation below keeps the extension unchanged
+        stem, extension = os.path.splitext(target_name)
+        if extension == '.':  # Path.suffix treats a trailing dot as no extension
+            stem, extension = target_name, ''
+        
         # Check length constraints
         if len(target_name) > self.max_filename_length:
             # Try to truncate the original name part while keeping extension
-            path_obj = Path(target_name)
-            extension = path_obj.suffix
             prefix_part = target_name[:target_name.find('_') + 1]  # Include underscore
-            name_part = path_obj.stem[len(prefix_part) - 1:]  # Remove underscore from count
+            name_part = stem[len(prefix_part) - 1:]  # Remove underscore from count
             
             # Calculate available space for name part
             available_length = self.max_filename_length - len(prefix_part) - len(extension)
@@ -164,7 +211,7 @@ class PrefixValidator(PrefixValidatorInterface):
         
         # Extension validation if restricted
         if self.allowed_extensions:
-            extension = Path(target_name).suffix.lower()
+            extension = extension.lower()
             if extension and extension not in self.allowed_extensions:
                 raise ValidationError(
                     f"File extension {extension} not in allowed list: {self.allowed_extensions}"
@@ -187,9 +234,8 @@ class PrefixValidator(PrefixValidatorInterface):
             True if target name is safe, False otherwise
         """
         try:
-            # Basic filename structure validation
-            if not self._validate_filename_structure(target_name):
-                return False
+            # Checks run cheapest first; only the collision check touches
+            # the filesystem, so it runs last
             
             # Length validation
             if len(target_name) > self.max_filename_length:
@@ -201,21 +247,34 @@ class PrefixValidator(PrefixValidatorInterface):
                 if extension and extension not in self.allowed_extensions:
                     return False
             
+            # Structure and platform-specific validations
+            if not self._validate_name_syntax(target_name):
+                return False
+            
             # Path collision validation
             target_path = original_path.parent / target_name
             if self._check_path_collision(target_path, original_path):
                 return False
             
-            # Platform-specific validations
-            if not self._validate_platform_compatibility(target_name):
-                return False
-            
             return True
             
         except Exception:
             # Any unexpected error during validation means unsafe
             return False
     
+    def _validate_name_syntax(self, filename: str) -> bool:
+        """
+        Run the in-memory filename checks, stopping at the first failure.
+        
+        Args:
+            filename: Filename to validate
+            
+        Returns:
+            True if both structure and platform checks pass, False otherwise
+        """
+        return (self._validate_filename_structure(filename)
+                and self._validate_platform_compatibility(filename))
+    
     def _validate_filename_structure(self, filename: str) -> bool:
         """
         Validate basic filename structure and content.
@@ -230,21 +289,11 @@ class PrefixValidator(PrefixValidatorInterface):
             return False
         
         # Check for forbidden patterns based on validation level
-        if self.validation_level == ValidationLevel.DISABLED:
+        forbidden_regex = self._forbidden_regex_by_level.get(self.validation_level)
+        if forbidden_regex is None:
             return True
         
-        patterns_to_check = []
-        if self.validation_level in [ValidationLevel.STRICT, ValidationLevel.NORMAL]:
-            patterns_to_check.extend(self.forbidden_regexes[:4])  # Basic patterns
-        
-        if self.validation_level == ValidationLevel.STRICT:
-            patterns_to_check.extend(self.forbidden_regexes[4:])  # All patterns
-        
-        for pattern in patterns_to_check:
-            if pattern.search(filename):
-                return False
-        
-        return True
+        return forbidden_regex.search(filename) is None
     
     def _check_path_collision(self, target_path: Path, original_path: Path) -> bool:
         """
@@ -266,14 +315,49 @@ class PrefixValidator(PrefixValidatorInterface):
             return True
         
         # Case-insensitive collision check on case-insensitive filesystems
-        if self._is_case_insensitive_filesystem(target_path.parent):
-            for existing_item in target_path.parent.iterdir():
-                if existing_item.name.lower() == target_path.name.lower():
-                    if existing_item != original_path:  # Don't count self
-                        return True
+        directory = target_path.parent
+        if self._is_case_insensitive_filesystem(directory):
+            names_by_lower = self._dir_cache.get(directory)
+            if names_by_lower is None:
+                names_by_lower = self._read_directory_names(directory)
+            
+            for existing_name in names_by_lower.get(target_path.name.lower(), ()):
+                if directory / existing_name != original_path:  # Don't count self
+                    return True
         
         return False
     
+    def _read_directory_names(self, directory: Path) -> Dict[str, Set[str]]:
+        """
+        List a directory's entry names grouped by their lowercased form.
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            Mapping of lowercased name to the actual entry names
+        """
+        names_by_lower: Dict[str, Set[str]] = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                names_by_lower.setdefault(entry.name.lower(), set()).add(entry.name)
+        return names_by_lower
+    
+    def _prime_directory_cache(self, directory: Path) -> Dict[str, Set[str]]:
+        """
+        Read a directory once and cache its names for collision checks.
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            Cached mapping of lowercased name to the actual entry names
+        """
+        names_by_lower = self._dir_cache.get(directory)
+        if names_by_lower is None:
+            names_by_lower = self._dir_cache[directory] = self._read_directory_names(directory)
+        return names_by_lower
+    
     def _validate_platform_compatibility(self, filename: str) -> bool:
         """
         Validate filename for cross-platform compatibility.
@@ -284,60 +368,23 @@ class PrefixValidator(PrefixValidatorInterface):
         Returns:
             True if compatible across platforms, False otherwise
         """
-        # Windows reserved names check
-        name_part = Path(filename).stem.upper()
-        reserved_names = [
-            'CON', 'PRN', 'AUX', 'NUL',
-            'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-            'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-        ]
-        
-        if name_part in reserved_names:
-            return False
-        
-        # Check for characters problematic on Windows
-        problematic_chars = set('<>:"|?*')
-        if any(char in filename for char in problematic_chars):
-            return False
-        
-        # Control characters check
-        if any(ord(char) < 32 for char in filename):
-            return False
-        
-        return True
+        # Windows reserved names, problematic and control characters, in one pass
+        return self._PLATFORM_INCOMPATIBLE_REGEX.search(filename) is None
     
     def _is_case_insensitive_filesystem(self, directory: Path) -> bool:
         """
         Detect if the filesystem is case-insensitive.
         
+        Based on the platform, which is resolved once at import; no
+        filesystem probes are made per call.
+        
         Args:
             directory: Directory to test
             
         Returns:
             True if filesystem is case-insensitive, False otherwise
         """
-        try:
-            # Create test files with different cases
-            test_lower = directory / "test_case_sensitivity.tmp"
-            test_upper = directory / "TEST_CASE_SENSITIVITY.TMP"
-            
-            # If both exist as same file, filesystem is case-insensitive
-            if test_lower.exists() and test_upper.exists():
-                return test_lower.samefile(test_upper)
-            
-            # Fallback: common filesystem detection
-            import platform
-            system = platform.system().lower()
-            if system == 'windows':
-                return True
-            elif system == 'darwin':  # macOS
-                return True  # Most macOS installations use case-insensitive APFS/HFS+
-            else:
-                return False  # Linux typically case-sensitive
-                
-        except Exception:
-            # Conservative fallback
-            return True
+        return _CASE_INSENSITIVE_PLATFORM
     
     def validate_batch_operations(self, operations: List[Tuple[str, str, Path]]) -> List[str]:
         """
@@ -350,20 +397,34 @@ class PrefixValidator(PrefixValidatorInterface):
             List of error messages (empty if all valid)
         """
         errors = []
-        target_names = set()
         
-        for original_name, target_name, path in operations:
-            # Individual name validation
-            if not self.validate_target_name(target_name, path):
-                errors.append(f"Invalid target name: {target_name}")
-                continue
-            
-            # Batch collision detection
-            target_lower = target_name.lower()
-            if target_lower in target_names:
-                errors.append(f"Duplicate target name in batch: {target_name}")
-            else:
-                target_names.add(target_lower)
+        # Count every target name up front so all occurrences of a duplicate
+        # are reported, not just the second and later ones
+        name_counts = Counter(target_name.lower() for _, target_name, _ in operations)
+        duplicate_names = {name for name, count in name_counts.items() if count > 1}
+        
+        # Read each parent directory once for the whole batch rather than once
+        # per case-insensitive collision check
+        if _CASE_INSENSITIVE_PLATFORM:
+            for directory in {path.parent for _, _, path in operations}:
+                try:
+                    self._prime_directory_cache(directory)
+                except OSError:
+                    pass  # Left uncached; the per-item check reports the failure
+        
+        try:
+            for original_name, target_name, path in operations:
+                # Individual name validation
+                if not self.validate_target_name(target_name, path):
+                    errors.append(f"Invalid target name: {target_name}")
+                    continue
+                
+                # Batch collision detection
+                if target_name.lower() in duplicate_names:
+                    errors.append(f"Duplicate target name in batch: {target_name}")
+        finally:
+            # Listings go stale as soon as renames start
+            self._dir_cache.clear()
         
         return errors
     
@@ -383,12 +444,27 @@ class PrefixValidator(PrefixValidatorInterface):
         stem = path_obj.stem
         suffix = path_obj.suffix
         
+        # Every candidate shares the target's extension
+        if self.allowed_extensions and suffix and suffix.lower() not in self.allowed_extensions:
+            return None
+        
+        # List the directory once instead of stat-ing each candidate
+        names_by_lower = self._dir_cache.get(directory)
+        if names_by_lower is None:
+            try:
+                names_by_lower = self._read_directory_names(directory)
+            except OSError:
+                names_by_lower = {}
+        case_insensitive = self._is_case_insensitive_filesystem(directory)
+        
         for i in range(1, max_attempts + 1):
             alternative = f"{stem}_{i:03d}{suffix}"
-            alternative_path = directory / alternative
             
-            if not alternative_path.exists():
-                if self.validate_target_name(alternative, directory / "dummy"):
-                    return alternative
+            matches = names_by_lower.get(alternative.lower(), ())
+            if matches and (case_insensitive or alternative in matches):
+                continue
+            
+            if len(alternative) <= self.max_filename_length and self._validate_name_syntax(alternative):
+                return alternative
         
         return None
\ No newline at end of file
@@ -83,13 +83,16 @@ class TestFixtureManager:
         test_dir.mkdir(parents=True, exist_ok=True)
         self.temp_directories.append(test_dir)
         
+        # Create each subdirectory once, parents before children
+        subdirectories = sorted({tf.subdirectory for tf in files if tf.subdirectory})
+        for subdirectory in subdirectories:
+            (test_dir / subdirectory).mkdir(parents=True, exist_ok=True)
+        
         # Create all specified files and directories
         for test_file in files:
             # Handle subdirectory structure
             if test_file.subdirectory:
-                file_parent = test_dir / test_file.subdirectory
-                file_parent.mkdir(parents=True, exist_ok=True)
-                file_path = file_parent / test_file.name
+                file_path = test_dir / test_file.subdirectory / test_file.name
             else:
                 file_path = test_dir / test_file.name
             
@@ -97,7 +100,7 @@ class TestFixtureManager:
             if test_file.is_directory:
                 file_path.mkdir(parents=True, exist_ok=True)
             else:
-                file_path.write_text(test_file.content, encoding='utf-8')
+                file_path.write_bytes(test_file.content.encode('utf-8'))
             
             # Set timestamps if specified
             self._set_file_timestamps(file_path, test_file.creation_date, test_file.modification_date)
@@ -228,17 +231,24 @@ def create_large_directory_structure() -> List[TestFile]:
     files = []
     base_date = datetime(2024, 1, 1, 0, 0, 0)
     
+    # Bound %-formatters, so the loops below don't re-parse format specs
+    file_name = "file_%03d.txt".__mod__
+    file_content = "Content for file %d".__mod__
+    dir_name_for = "folder_%02d".__mod__
+    nested_name = "nested_file_%02d.dat".__mod__
+    nested_content = "Nested content %d-%d".__mod__
+    
     # Create 100 files in root
     for i in range(100):
         files.append(TestFile(
-            name=f"file_{i:03d}.txt",
-            content=f"Content for file {i}",
+            name=file_name(i),
+            content=file_content(i),
             creation_date=base_date + timedelta(minutes=i)
         ))
     
     # Create 10 directories with 20 files each
     for dir_num in range(10):
-        dir_name = f"folder_{dir_num:02d}"
+        dir_name = dir_name_for(dir_num)
         files.append(TestFile(
             name=dir_name,
             is_directory=True,
@@ -247,8 +257,8 @@ def create_large_directory_structure() -> List[TestFile]:
         
         for file_num in range(20):
             files.append(TestFile(
-                name=f"nested_file_{file_num:02d}.dat",
-                content=f"Nested content {dir_num}-{file_num}",
+                name=nested_name(file_num),
+                content=nested_content((dir_num, file_num)),
                 subdirectory=dir_name,
                 creation_date=base_date + timedelta(hours=dir_num, minutes=file_num)
             ))
@@ -0,0 +1,76 @@
+"""
+Unit tests for the custom exception classes.
+"""
+
+import copy
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.utils.exceptions import (
+    AppFileNotFoundError,
+    AppPermissionError,
+    BatchOperationError,
+    ConfigurationError,
+    DatePrefixRenamerError,
+    DateExtractionError,
+    DiskSpaceError,
+    FileConflictError,
+    FileSystemError,
+    InvalidFilenameError,
+    ProcessingSessionError,
+    RenameOperationError,
+    ValidationError,
+)
+
+
+EXCEPTIONS = [
+    DatePrefixRenamerError("m", details="d", error_code="E"),
+    FileSystemError("m", path=Path("/a"), operation="op", details="d"),
+    AppFileNotFoundError(Path("/a"), details="d"),
+    AppFileNotFoundError._fast(Path("/a"), "scan", "d"),
+    AppPermissionError(Path("/a"), "rename"),
+    AppPermissionError._fast(Path("/a"), "rename"),
+    DiskSpaceError(Path("/a"), required_space=2048, available_space=1024),
+    ValidationError("m", field="f", value="v", constraint="c"),
+    InvalidFilenameError("bad?.txt", "forbidden character"),
+    DateExtractionError("m", path=Path("/a"), date_source="mtime"),
+    RenameOperationError("m", source_path=Path("/a"), target_path=Path("/b"), operation_id="1"),
+    FileConflictError(Path("/a"), Path("/b/c.txt")),
+    ProcessingSessionError("m", session_id="s", session_state="running"),
+    BatchOperationError("m", failed_operations=["x"], completed_operations=["y", "z"],
+                        rollback_possible=True),
+    ConfigurationError("m", config_key="k", config_value="v"),
+]
+
+
+@pytest.mark.parametrize("error", EXCEPTIONS, ids=lambda error: type(error).__name__)
+@pytest.mark.parametrize("clone", [copy.copy, lambda error: pickle.loads(pickle.dumps(error))],
+                         ids=["copy", "pickle"])
+def test_exception_round_trip_keeps_context(error, clone):
+    """Copied and unpickled errors keep every context field."""
+    expected = str(error)
+
+    restored = clone(error)
+
+    assert type(restored) is type(error)
+    assert str(restored) == expected
+    assert restored.args == error.args
+    assert restored.error_code == error.error_code
+
+
+@pytest.mark.parametrize("error, expected", [
+    (DatePrefixRenamerError("m"), "m"),
+    (DatePrefixRenamerError("m", details="d"), "m Details: d"),
+    (FileSystemError("m", path=Path("/a"), operation="op", details="d"),
+     "m | Path: /a | Operation: op | Details: d"),
+    (FileSystemError("m", details="d"), "m | Details: d"),
+    (ValidationError("m", field="f", value="v", constraint="c", details="d"),
+     "m | Field: f | Value: v | Constraint: c | Details: d"),
+    (BatchOperationError("m", failed_operations=["x"], details="d"),
+     "m | Failed: 1 operations | Rollback possible: False | Details: d"),
+])
+def test_exception_str_format(error, expected):
+    """Each exception renders its message, context and details as before."""
+    assert str(error) == expected
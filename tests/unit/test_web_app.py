@@ -0,0 +1,42 @@
+"""
+Unit tests for the Flask web interface.
+"""
+
+import io
+import os
+import stat
+
+import pytest
+
+pytest.importorskip("flask")
+
+import web_app
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client whose uploads and staging folder live under tmp_path."""
+    monkeypatch.setitem(web_app.app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    monkeypatch.setitem(web_app.app.config, 'TEMP_UPLOAD_FOLDER', str(tmp_path / '.uploads'))
+    monkeypatch.setattr(web_app, '_staging_folder', None)
+    monkeypatch.setattr(web_app, 'session_dir_pool', web_app.queue.Queue())
+    return web_app.app.test_client()
+
+
+def test_uploaded_file_gets_default_mode_without_o_tmpfile(client, tmp_path, monkeypatch):
+    """Files staged as named .part- files are delivered with umask permissions, not 0600."""
+    monkeypatch.setattr(web_app, '_linkat', None)
+    umask = os.umask(0)
+    os.umask(umask)
+
+    response = client.post('/upload', data={'files[]': [(io.BytesIO(b'hello'), 'a.txt')]},
+                           content_type='multipart/form-data')
+    assert response.status_code == 200
+    new_name = response.json['preview'][0]['new']
+
+    response = client.post('/execute', json={'session_id': response.json['session_id']})
+    assert response.json['success'] == 1
+
+    delivered = tmp_path / new_name
+    assert delivered.read_bytes() == b'hello'
+    assert stat.S_IMODE(delivered.stat().st_mode) == 0o666 & ~umask
@@ -3,39 +3,417 @@ Web-based GUI for Date Prefix Renamer
 Flask application for Docker deployment
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Request, render_template, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+from flask.logging import default_handler
+from werkzeug.formparser import FormDataParser, MultiPartParser
 from werkzeug.utils import secure_filename
+import atexit
+import ctypes
+import errno
+import logging
+import logging.handlers
 import os
-from pathlib import Path
-from datetime import datetime
+import queue
+import re
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+import secrets
 import shutil
-import uuid
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class LargeBufferFormDataParser(FormDataParser):
+    """Form parser that reads multipart bodies in chunks of up to MULTIPART_READ_SIZE"""
+    
+    def _parse_multipart(self, stream, mimetype, content_length, options):
+        # Copy of the Werkzeug 3.0/3.1 implementation (requirements.txt pins
+        # that range; re-check this body before widening it), passing
+        # buffer_size, whose 64KB default costs a read()/write() pair per
+        # 64KB of every upload. The decoder rejects a buffered chunk larger
+        # than max_form_memory_size, so the chunk is capped at half of it:
+        # with Flask 3.1's default 500KB limit reads are 250KB, and the full
+        # MULTIPART_READ_SIZE only applies once MAX_FORM_MEMORY_SIZE is 2MB+.
+        buffer_size = MULTIPART_READ_SIZE
+        if self.max_form_memory_size is not None:
+            buffer_size = max(64 * 1024, min(buffer_size, self.max_form_memory_size // 2))
+        
+        parser = MultiPartParser(
+            stream_factory=self.stream_factory,
+            max_form_memory_size=self.max_form_memory_size,
+            max_form_parts=self.max_form_parts,
+            cls=self.cls,
+            buffer_size=buffer_size,
+        )
+        boundary = options.get("boundary", "").encode("ascii")
+        
+        if not boundary:
+            raise ValueError("Missing boundary")
+        
+        form, files = parser.parse(stream, boundary, content_length)
+        return stream, form, files
+
+class StagingRequest(Request):
+    """Request that spools uploaded file parts straight into the staging folder"""
+    
+    form_data_parser_class = LargeBufferFormDataParser
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        # The parser writes each part here once; upload_files then links or
+        # renames it into place instead of copying it out of a Werkzeug temp file
+        staging_dir = staging_folder()
+        if _linkat is not None and hasattr(os, 'O_TMPFILE'):
+            # An unnamed file disappears by itself if the upload is abandoned
+            # or the process dies, so no .part- files are left behind
+            try:
+                return open(os.open(staging_dir, os.O_TMPFILE | os.O_RDWR, 0o666), 'wb+')
+            except OSError:
+                pass  # Filesystem without O_TMPFILE support
+        # Named .part- file, created like any other file (0666 less the umask)
+        # rather than 0600 as tempfile would, since it is renamed into place
+        while True:
+            try:
+                return open(os.path.join(staging_dir, f'.part-{secrets.token_hex(8)}'), 'xb+')
+            except FileExistsError:
+                continue
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson, used when it is installed"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
 
 app = Flask(__name__)
+app.request_class = StagingRequest
+if orjson is not None:
+    # Large upload previews are encoded much faster than with the stdlib
+    app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500MB max
 
+def configure_logging():
+    """Send app.logger through a queue so request threads never block on stderr"""
+    # LOG_LEVEL is the variable documented by the Docker entrypoint
+    level = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').upper())
+    app.logger.setLevel(level if isinstance(level, int) else logging.INFO)
+    
+    # Flask's default handler writes to stderr; run it on a listener thread
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, default_handler)
+    app.logger.removeHandler(default_handler)
+    app.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
+configure_logging()
+
 # Use /data directory if available (Docker), otherwise use user's Documents
 base_dir = '/data' if os.path.exists('/data') else os.path.expanduser('~/Documents')
 app.config['UPLOAD_FOLDER'] = base_dir
 app.config['TEMP_UPLOAD_FOLDER'] = os.path.join(base_dir, '.uploads')
 
-# Create temp upload folder if it doesn't exist
-os.makedirs(app.config['TEMP_UPLOAD_FOLDER'], exist_ok=True)
+# Creation time where the platform reports it (macOS), else modification time
+DATE_STAT_ATTR = 'st_birthtime' if hasattr(os.stat_result, 'st_birthtime') else 'st_mtime'
+
+# Upper bound on concurrent renames in execute_rename
+RENAME_MAX_WORKERS = 8
+
+# renameat2() arguments for an atomic rename that refuses to overwrite, and
+# linkat() arguments for naming an O_TMPFILE file through /proc
+AT_FDCWD = -100
+RENAME_NOREPLACE = 1
+AT_SYMLINK_FOLLOW = 0x400
+
+def _load_libc_function(name, argtypes):
+    """Return a libc function, or None where it isn't available"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        func = getattr(ctypes.CDLL(None, use_errno=True), name)
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = argtypes
+    func.restype = ctypes.c_int
+    return func
+
+_renameat2 = _load_libc_function(
+    'renameat2', [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint])
+_linkat = _load_libc_function(
+    'linkat', [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_int])
+
+# Chunk size for copying uploaded streams into the staging folder
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Largest chunk for reading multipart request bodies; LargeBufferFormDataParser
+# caps it at half of MAX_FORM_MEMORY_SIZE
+MULTIPART_READ_SIZE = 1024 * 1024
+
+# Names that secure_filename() would return unchanged: plain ASCII
+# [A-Za-z0-9_.-] that doesn't start or end with '.' or '_'
+SAFE_FILENAME_RE = re.compile(r'[A-Za-z0-9-](?:[A-Za-z0-9_.-]*[A-Za-z0-9-])?')
+
+# Characters secure_filename() strips after turning whitespace into '_'
+FILENAME_STRIP_RE = re.compile(r'[^A-Za-z0-9_.-]')
+
+# Store session data, oldest first; the dev server is threaded, so access
+# goes through the lock
+sessions = OrderedDict()
+sessions_lock = threading.Lock()
+SESSION_TTL_SECONDS = 60 * 60  # Unexecuted uploads are discarded after an hour
+MAX_SESSIONS = 256  # Oldest pending uploads are discarded beyond this many
+SESSION_SWEEP_INTERVAL = 5 * 60  # Expired sessions are also swept this often
+session_sweeper = None
+
+# Resolved on first upload by staging_folder()
+_staging_folder = None
+
+# Deletes session folders off the request thread, so responses don't wait
+# on a recursive delete
+cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='session-cleanup')
 
-# Store session data
-sessions = {}
+# Emptied session folders kept for reuse by later uploads
+SESSION_DIR_POOL_SIZE = 32
+session_dir_pool = queue.Queue(maxsize=SESSION_DIR_POOL_SIZE)
+
+def new_session_folder():
+    """Return an empty session folder, reusing a pooled one when available"""
+    try:
+        return session_dir_pool.get_nowait()
+    except queue.Empty:
+        session_folder = os.path.join(staging_folder(), secrets.token_hex(16))
+        os.makedirs(session_folder, exist_ok=True)
+        return session_folder
+
+def remove_session_folder(session_folder, label='Cleaned up'):
+    """Delete a session's staging folder, or pool it if already empty"""
+    try:
+        # After a successful execute everything has been moved out, so the
+        # folder can go straight back to the pool without an rmtree
+        with os.scandir(session_folder) as entries:
+            empty = next(entries, None) is None
+        if empty:
+            try:
+                session_dir_pool.put_nowait(session_folder)
+                return
+            except queue.Full:
+                os.rmdir(session_folder)
+        else:
+            shutil.rmtree(session_folder)
+        app.logger.debug("%s session folder: %s", label, session_folder)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        app.logger.warning("Error cleaning up %s: %s", session_folder, e)
+
+@atexit.register
+def drain_session_dir_pool():
+    """Remove pooled session folders when the server exits"""
+    # Let queued cleanups finish first so they don't refill the pool
+    cleanup_executor.shutdown(wait=True)
+    while True:
+        try:
+            session_folder = session_dir_pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            os.rmdir(session_folder)
+        except OSError:
+            pass
+
+def discard_sessions(discarded):
+    """Delete the staged uploads of sessions removed from the store"""
+    for data in discarded:
+        cleanup_executor.submit(remove_session_folder, data['session_folder'], 'Discarded')
+
+def sweep_sessions():
+    """Evict expired sessions periodically, so an idle server still frees abandoned uploads"""
+    while True:
+        time.sleep(SESSION_SWEEP_INTERVAL)
+        evict_expired_sessions()
+
+def put_session(session_id, data):
+    """Store a session, evicting the oldest ones beyond MAX_SESSIONS"""
+    global session_sweeper
+    with sessions_lock:
+        # Start sweeping with the first session rather than at import
+        if session_sweeper is None:
+            session_sweeper = threading.Thread(target=sweep_sessions, name='session-sweeper', daemon=True)
+            session_sweeper.start()
+        sessions[session_id] = data
+        sessions.move_to_end(session_id)
+        evicted = []
+        while len(sessions) > MAX_SESSIONS:
+            evicted.append(sessions.popitem(last=False)[1])
+    
+    discard_sessions(evicted)
+
+def evict_expired_sessions():
+    """Drop sessions older than SESSION_TTL_SECONDS and delete their uploads"""
+    cutoff = time.monotonic() - SESSION_TTL_SECONDS
+    expired = []
+    with sessions_lock:
+        # Sessions are kept in creation order, so stop at the first live one
+        while sessions and next(iter(sessions.values()))['created'] < cutoff:
+            expired.append(sessions.popitem(last=False)[1])
+    
+    if expired:
+        app.logger.info("Evicting %d expired session(s)", len(expired))
+    discard_sessions(expired)
+
+def date_from_stat(stat_info):
+    """Get creation date from a stat result, falling back to modification date"""
+    return datetime.fromtimestamp(getattr(stat_info, DATE_STAT_ATTR))
+
+@lru_cache(maxsize=4096)
+def format_date_ordinal(ordinal):
+    """Return the (name prefix, ISO date) strings for a date ordinal"""
+    day = date.fromordinal(ordinal)
+    return day.strftime("%d%m%Y"), day.strftime('%Y-%m-%d')
+
+def format_date(file_date):
+    """Format a date for the preview; uploads share few dates, so cache by day"""
+    return format_date_ordinal(file_date.toordinal())
 
 def get_file_date(file_path):
     """Get file creation or modification date"""
     try:
-        stat_info = Path(file_path).stat()
-        if hasattr(stat_info, 'st_birthtime'):
-            return datetime.fromtimestamp(stat_info.st_birthtime)
-        else:
-            return datetime.fromtimestamp(stat_info.st_mtime)
+        return date_from_stat(os.stat(file_path))
     except Exception:
         return datetime.now()
 
+def staging_folder():
+    """Return the upload staging folder, on the same filesystem as UPLOAD_FOLDER"""
+    global _staging_folder
+    if _staging_folder is None:
+        upload_folder = app.config['UPLOAD_FOLDER']
+        folder = app.config['TEMP_UPLOAD_FOLDER']
+        os.makedirs(folder, exist_ok=True)
+        
+        # Moving out of staging is only a rename on the same device; a
+        # separately mounted staging folder would copy every upload twice,
+        # so stage beside the destination instead
+        if os.stat(folder).st_dev != os.stat(upload_folder).st_dev:
+            folder = os.path.join(upload_folder, '.uploads-staging')
+            os.makedirs(folder, exist_ok=True)
+            app.logger.warning("Temp upload folder is on another device, staging in %s", folder)
+        
+        _staging_folder = folder
+    return _staging_folder
+
+def discard_staged_parts(files):
+    """Delete spooled upload parts that were not moved into a session folder"""
+    for file in files:
+        path = getattr(file.stream, 'name', None)
+        if isinstance(path, int):
+            # Unnamed O_TMPFILE part; closing it frees it
+            file.stream.close()
+        elif isinstance(path, str):
+            file.stream.close()
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+def link_open_file(fd, filepath):
+    """Give an unnamed O_TMPFILE file a name, replacing an existing file as rename would"""
+    # os.link() calls link(), which won't follow the /proc symlink to the
+    # open file, so go through linkat(AT_SYMLINK_FOLLOW)
+    proc_path = os.fsencode(f'/proc/self/fd/{fd}')
+    target = os.fsencode(filepath)
+    if _linkat(AT_FDCWD, proc_path, AT_FDCWD, target, AT_SYMLINK_FOLLOW) == 0:
+        return
+    err = ctypes.get_errno()
+    if err == errno.EEXIST:
+        os.unlink(filepath)
+        if _linkat(AT_FDCWD, proc_path, AT_FDCWD, target, AT_SYMLINK_FOLLOW) == 0:
+            return
+        err = ctypes.get_errno()
+    raise OSError(err, os.strerror(err), filepath)
+
+def store_upload(file, filepath):
+    """Move a spooled upload part to filepath, copying only if it wasn't spooled to disk"""
+    path = getattr(file.stream, 'name', None)
+    if isinstance(path, int):
+        file.stream.flush()
+        link_open_file(path, filepath)
+        file.stream.close()
+    elif isinstance(path, str):
+        file.stream.close()
+        os.rename(path, filepath)
+    else:
+        # Copy in large chunks rather than Werkzeug's 16KB default
+        file.save(filepath, buffer_size=UPLOAD_COPY_BUFFER_SIZE)
+
+def fast_secure_filename(name):
+    """secure_filename() with fast paths for ASCII names"""
+    # Windows device names are rewritten by secure_filename, so no fast path there
+    if os.name != 'nt' and name.isascii():
+        if SAFE_FILENAME_RE.fullmatch(name):
+            return name
+        # secure_filename()'s own steps; NFKD normalization leaves ASCII as is
+        name = "_".join(name.replace(os.sep, ' ').split())
+        return FILENAME_STRIP_RE.sub('', name).strip('._')
+    return secure_filename(name)
+
+def sync_directories(directories):
+    """Flush directory entries to disk once per directory after a batch of renames"""
+    # Directories can't be opened for fsync on Windows
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    
+    for directory in directories:
+        try:
+            fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            app.logger.warning("Error opening %s for sync: %s", directory, e)
+            continue
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            app.logger.warning("Error syncing %s: %s", directory, e)
+        finally:
+            os.close(fd)
+
+def stat_files(paths):
+    """Stat files one directory scan at a time, returning {path: stat_result}"""
+    # Group by directory so each is scanned once; on Windows scandir entries
+    # carry their stat data, elsewhere entry.stat() costs the same as os.stat
+    wanted = {}
+    for path in paths:
+        wanted.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+    
+    stats = {}
+    for directory, names in wanted.items():
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        try:
+                            stats[entry.path] = entry.stat()
+                        except OSError:
+                            pass
+        except OSError as e:
+            app.logger.warning("Error scanning %s: %s", directory, e)
+    return stats
+
 def generate_preview(files):
     """Generate preview of rename operations"""
     preview = []
@@ -53,14 +431,13 @@ def generate_preview(files):
     if is_folder_upload and top_folder:
         # For folder uploads, show only the folder rename
         first_file_path = files[0]['path']
-        file_date = get_file_date(first_file_path)
-        date_prefix = file_date.strftime("%d%m%Y")
+        date_prefix, iso_date = format_date(get_file_date(first_file_path))
         new_folder_name = f"{date_prefix}_{top_folder}"
         
         preview.append({
             'original': top_folder,
             'new': new_folder_name,
-            'date': file_date.strftime('%Y-%m-%d'),
+            'date': iso_date,
             'path': top_folder,
             'size': 0,
             'type': 'folder',
@@ -68,13 +445,24 @@ def generate_preview(files):
         })
     else:
         # For file uploads, show each file rename
+        stats = stat_files(file_info['path'] for file_info in files)
+        # Files that can't be stat'ed all get the same date, read once
+        fallback_date = None
         for file_info in files:
             original_name = file_info['name']
             file_path = file_info['path']
             
-            # Get file date
-            file_date = get_file_date(file_path)
-            date_prefix = file_date.strftime("%d%m%Y")
+            # One stat per file gives both the date and the size
+            stat_info = stats.get(file_path)
+            if stat_info is not None:
+                file_date = date_from_stat(stat_info)
+                file_size = stat_info.st_size
+            else:
+                if fallback_date is None:
+                    fallback_date = datetime.now()
+                file_date = fallback_date
+                file_size = 0
+            date_prefix, iso_date = format_date(file_date)
             
             # Generate new name
             new_name = f"{date_prefix}_{original_name}"
@@ -82,14 +470,133 @@ def generate_preview(files):
             preview.append({
                 'original': original_name,
                 'new': new_name,
-                'date': file_date.strftime('%Y-%m-%d'),
+                'date': iso_date,
                 'path': file_path,
-                'size': os.path.getsize(file_path) if os.path.exists(file_path) else 0,
+                'size': file_size,
                 'type': 'file'
             })
     
     return preview
 
+def copy_file_contents(src, dst):
+    """Copy between open files in the kernel where possible"""
+    if hasattr(os, 'copy_file_range'):
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        try:
+            while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                pass
+            return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+        # Start over with a plain copy
+        src.seek(0)
+        dst.seek(0)
+        dst.truncate()
+    
+    shutil.copyfileobj(src, dst, UPLOAD_COPY_BUFFER_SIZE)
+
+def move_across_devices(old_path, new_path):
+    """Copy a file to new_path on another filesystem, then remove the original"""
+    # Opening with 'x' refuses an existing target, like the rename would
+    with open(old_path, 'rb') as src, open(new_path, 'xb') as dst:
+        try:
+            copy_file_contents(src, dst)
+        except BaseException:
+            dst.close()
+            os.unlink(new_path)
+            raise
+    
+    # Keep the timestamps the dated name was derived from
+    shutil.copystat(old_path, new_path)
+    os.unlink(old_path)
+
+def move_without_replacing(old_path, new_path):
+    """Move a file to new_path, raising FileExistsError instead of overwriting"""
+    # renameat2(RENAME_NOREPLACE) does the check and the move in one syscall;
+    # filesystems that don't support the flag report EINVAL
+    if _renameat2 is not None:
+        if _renameat2(AT_FDCWD, os.fsencode(old_path), AT_FDCWD, os.fsencode(new_path),
+                      RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err == errno.EXDEV:
+            move_across_devices(old_path, new_path)
+            return
+        if err not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(err, os.strerror(err), old_path, None, new_path)
+    
+    # A hard link fails atomically if the target exists, so there is no window
+    # between an exists check and the rename
+    try:
+        os.link(old_path, new_path)
+    except FileExistsError:
+        raise
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            move_across_devices(old_path, new_path)
+            return
+        # Filesystems without hard links (FAT, some network shares) fall back
+        # to check-then-rename. On Windows os.rename itself refuses an
+        # existing target, but elsewhere this branch is best effort: a file
+        # created at new_path between the check and the rename is replaced.
+        # Uploads only reach it on such filesystems, where failing closed
+        # would make every rename fail.
+        if os.path.lexists(new_path):
+            raise FileExistsError(new_path) from None
+        os.rename(old_path, new_path)
+    else:
+        os.unlink(old_path)
+
+def rename_preview_item(entry, final_dir, claimed_names, claim_lock):
+    """Move one planned upload to its dated name in final_dir and return its result"""
+    old_path, old_name, new_name = entry
+    
+    try:
+        new_path = os.path.join(final_dir, new_name)
+        
+        # Claim the name first so two workers can't both pass the exists check
+        # for the same target and have one silently overwrite the other
+        with claim_lock:
+            taken = new_path in claimed_names
+            claimed_names.add(new_path)
+        
+        if taken:
+            raise FileExistsError(new_path)
+        
+        move_without_replacing(old_path, new_path)
+        app.logger.debug("Renamed file: %s -> %s", old_path, new_path)
+        
+        return {
+            'file': old_name,
+            'status': 'success',
+            'new_name': new_name,
+            'type': 'file'
+        }
+        
+    except FileExistsError:
+        return {
+            'file': old_name,
+            'status': 'error',
+            'message': 'Target file already exists'
+        }
+        
+    except Exception as e:
+        app.logger.warning("Error renaming %s: %s", old_name, e)
+        return {
+            'file': old_name,
+            'status': 'error',
+            'message': str(e)
+        }
+
+@app.teardown_request
+def cleanup_staged_parts(exc):
+    """Remove upload parts left in the staging folder when a request ends"""
+    # Only look if this request actually parsed a form
+    files = request.__dict__.get('files')
+    if files:
+        discard_staged_parts(file for _, file in files.items(multi=True))
+
 @app.route('/')
 def index():
     """Main page"""
@@ -106,12 +613,16 @@ def upload_files():
     if not files or all(f.filename == '' for f in files):
         return jsonify({'error': 'No files selected'}), 400
     
-    # Create unique session upload folder
-    session_id = str(uuid.uuid4())
-    session_folder = os.path.join(app.config['TEMP_UPLOAD_FOLDER'], session_id)
-    os.makedirs(session_folder, exist_ok=True)
+    evict_expired_sessions()
+    
+    # Get an empty session upload folder; staging_folder() creates the temp
+    # upload folder on first use, so health checks never touch the disk
+    session_id = secrets.token_hex(16)
+    session_folder = new_session_folder()
     
     uploaded_files = []
+    upload_errors = []
+    created_dirs = {session_folder}
     
     for file in files:
         if file.filename == '':
@@ -125,7 +636,7 @@ def upload_files():
             path_parts = []
             for part in file_path_rel.split('/'):
                 if part:
-                    safe_part = secure_filename(part)
+                    safe_part = fast_secure_filename(part)
                     if safe_part:
                         path_parts.append(safe_part)
             
@@ -138,42 +649,48 @@ def upload_files():
             # Save to session folder
             filepath = os.path.join(session_folder, safe_rel_path)
             
-            # Create subdirectories if needed
+            # Create subdirectories if needed (once per directory)
             directory = os.path.dirname(filepath)
-            os.makedirs(directory, exist_ok=True)
+            if directory not in created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                created_dirs.add(directory)
             
-            file.save(filepath)
+            store_upload(file, filepath)
             
             # Store with relative path for display
             uploaded_files.append({
                 'name': safe_rel_path,
                 'path': filepath
             })
-            print(f"Uploaded: {safe_rel_path} -> {filepath}")
+            app.logger.debug("Uploaded: %s -> %s", safe_rel_path, filepath)
             
         except Exception as e:
-            print(f"Error saving {file.filename}: {e}")
+            app.logger.warning("Error saving %s", file.filename, exc_info=True)
+            upload_errors.append({'file': file.filename, 'error': str(e)})
             continue
     
     if not uploaded_files:
-        return jsonify({'error': 'No valid files uploaded'}), 400
+        return jsonify({'error': 'No valid files uploaded', 'errors': upload_errors}), 400
     
     # Generate preview
     preview = generate_preview(uploaded_files)
     
-    # Store session data
-    sessions[session_id] = {
-        'preview': preview,
-        'files': uploaded_files,
-        'session_folder': session_folder
-    }
+    # Store session data; only what execute_rename needs, the full preview
+    # goes to the client
+    put_session(session_id, {
+        'plan': [(item['path'], item['original'], item['new']) for item in preview],
+        'is_folder': preview[0]['type'] == 'folder',
+        'session_folder': session_folder,
+        'created': time.monotonic()
+    })
     
-    print(f"Session {session_id}: {len(uploaded_files)} files uploaded")
+    app.logger.info("Session %s: %d files uploaded", session_id, len(uploaded_files))
     
     return jsonify({
         'session_id': session_id,
         'preview': preview,
-        'count': len(preview)
+        'count': len(preview),
+        'errors': upload_errors
     })
 
 @app.route('/execute', methods=['POST'])
@@ -181,58 +698,54 @@ def execute_rename():
     """Execute the rename operation"""
     data = request.json
     session_id = data.get('session_id')
+    # ?durable=0 skips the directory sync after the renames
+    durable = request.args.get('durable', '1') != '0'
     
-    if session_id not in sessions:
+    evict_expired_sessions()
+    
+    # Claim the session so a repeated request can't execute it twice
+    with sessions_lock:
+        session_data = sessions.pop(session_id, None)
+    
+    if session_data is None:
         return jsonify({'error': 'Invalid session'}), 400
     
-    session_data = sessions[session_id]
-    preview = session_data['preview']
+    plan = session_data['plan']
     session_folder = session_data.get('session_folder')
     results = []
     success_count = 0
+    # Directories whose entries changed, synced once at the end
+    synced_dirs = set()
     
-    # Get the top-level folder name from the first file's path
-    if session_data['files']:
-        first_file_rel_path = session_data['files'][0]['name']
-        print(f"DEBUG: first_file_rel_path = {first_file_rel_path}")
-        folder_parts = first_file_rel_path.split(os.sep)
-        print(f"DEBUG: folder_parts = {folder_parts}, len = {len(folder_parts)}")
-        
-        if len(folder_parts) > 1:
-            # Files are in a folder structure - rename the folder in its original location
-            top_folder = folder_parts[0]
-            print(f"DEBUG: Detected folder upload - top_folder = {top_folder}")
-            
-            # Get date from first file for the folder rename
-            first_item = preview[0]
-            file_date = datetime.strptime(first_item['date'], '%Y-%m-%d')
-            date_prefix = file_date.strftime("%d%m%Y")
-            new_folder_name = f"{date_prefix}_{top_folder}"
-            print(f"DEBUG: new_folder_name = {new_folder_name}")
+    if plan:
+        if session_data['is_folder']:
+            # Files are in a folder structure - the plan's single entry
+            # renames the top-level folder
+            _, top_folder, new_folder_name = plan[0]
+            app.logger.debug("Folder upload: %s -> %s", top_folder, new_folder_name)
             
             try:
-                # Get the original parent directory of where files were uploaded from
-                # The first file's original path tells us where it came from
-                first_file = uploaded_files[0]
-                first_path = first_file['path']
-                print(f"DEBUG: first_path = {first_path}")
-                
                 # Extract the original folder from session folder path
                 source_folder = os.path.join(session_folder, top_folder)
                 
                 # The destination is Documents folder
                 dest_folder = os.path.join(app.config['UPLOAD_FOLDER'], new_folder_name)
-                print(f"DEBUG: source_folder = {source_folder}")
-                print(f"DEBUG: dest_folder = {dest_folder}")
-                print(f"DEBUG: source exists = {os.path.exists(source_folder)}")
+                app.logger.debug("source_folder = %s, dest_folder = %s", source_folder, dest_folder)
                 
-                # Move entire folder with new name
-                if os.path.exists(source_folder):
+                # Move entire folder with new name; shutil.move would nest it
+                # inside an existing folder of the same name, so refuse that
+                if os.path.exists(dest_folder):
+                    results.append({
+                        'file': top_folder,
+                        'status': 'error',
+                        'message': 'Target folder already exists'
+                    })
+                elif os.path.exists(source_folder):
                     # Create parent directory if needed
                     os.makedirs(os.path.dirname(dest_folder), exist_ok=True)
                     shutil.move(source_folder, dest_folder)
-                    success_count = len(preview)
-                    print(f"DEBUG: Successfully moved folder to {dest_folder}")
+                    synced_dirs.add(os.path.dirname(dest_folder))
+                    success_count = len(plan)
                     
                     results.append({
                         'file': top_folder,
@@ -240,18 +753,16 @@ def execute_rename():
                         'new_name': new_folder_name,
                         'type': 'folder'
                     })
-                    print(f"Renamed folder: {source_folder} -> {dest_folder}")
+                    app.logger.debug("Renamed folder: %s -> %s", source_folder, dest_folder)
                 else:
-                    print(f"DEBUG: Source folder does not exist at {source_folder}")
+                    app.logger.debug("Source folder does not exist at %s", source_folder)
                     results.append({
                         'file': top_folder,
                         'status': 'error',
                         'message': f'Source folder not found at {source_folder}'
                     })
             except Exception as e:
-                print(f"Error renaming folder: {e}")
-                import traceback
-                traceback.print_exc()
+                app.logger.warning("Error renaming folder %s", top_folder, exc_info=True)
                 results.append({
                     'file': top_folder,
                     'status': 'error',
@@ -259,58 +770,43 @@ def execute_rename():
                 })
         else:
             # FILE UPLOAD: Rename individual files and save to Documents
-            for item in preview:
-                old_path = item['path']
-                old_name = item['original']
-                new_name = item['new']
+            final_dir = app.config['UPLOAD_FOLDER']
+            try:
+                os.makedirs(final_dir, exist_ok=True)
+            except Exception as e:
+                app.logger.warning("Error creating %s: %s", final_dir, e)
+                results = [
+                    {'file': old_name, 'status': 'error', 'message': str(e)}
+                    for _, old_name, _ in plan
+                ]
+            else:
+                # Renames release the GIL, so a few threads keep the disk busy;
+                # map() keeps results in plan order
+                claimed_names = set()
+                claim_lock = threading.Lock()
+                max_workers = max(1, min(RENAME_MAX_WORKERS, len(plan)))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(
+                        lambda entry: rename_preview_item(entry, final_dir, claimed_names, claim_lock),
+                        plan
+                    ))
                 
-                try:
-                    # Save to Documents folder
-                    final_dir = app.config['UPLOAD_FOLDER']
-                    os.makedirs(final_dir, exist_ok=True)
-                    new_path = os.path.join(final_dir, new_name)
-                    
-                    if os.path.exists(new_path):
-                        results.append({
-                            'file': old_name,
-                            'status': 'error',
-                            'message': 'Target file already exists'
-                        })
-                        continue
-                    
-                    os.rename(old_path, new_path)
-                    success_count += 1
-                    
-                    results.append({
-                        'file': old_name,
-                        'status': 'success',
-                        'new_name': new_name,
-                        'type': 'file'
-                    })
-                    print(f"Renamed file: {old_path} -> {new_path}")
-                    
-                except Exception as e:
-                    print(f"Error renaming {old_name}: {e}")
-                    results.append({
-                        'file': old_name,
-                        'status': 'error',
-                        'message': str(e)
-                    })
+                success_count = sum(1 for result in results if result['status'] == 'success')
+                if success_count:
+                    synced_dirs.add(final_dir)
     
-    # Cleanup session and temp folder
-    if session_folder and os.path.exists(session_folder):
-        try:
-            shutil.rmtree(session_folder)
-            print(f"Cleaned up session folder: {session_folder}")
-        except Exception as e:
-            print(f"Error cleaning up {session_folder}: {e}")
+    if durable:
+        sync_directories(synced_dirs)
+    
+    app.logger.info("Session %s: %d of %d renamed", session_id, success_count, len(plan))
     
-    if session_id in sessions:
-        del sessions[session_id]
+    # Cleanup session and temp folder in the background
+    if session_folder:
+        cleanup_executor.submit(remove_session_folder, session_folder)
     
     return jsonify({
         'success': success_count,
-        'total': len(preview),
+        'total': len(plan),
         'results': results
     })
 
@@ -319,6 +815,23 @@ def health():
     """Health check endpoint"""
     return jsonify({'status': 'healthy'})
 
+HEALTH_RESPONSE = b'{"status":"healthy"}\n'
+
+def serve_health_checks(wsgi_app):
+    """Answer GET /health before Flask dispatch; probes hit it many times a minute"""
+    headers = [('Content-Type', 'application/json'), ('Content-Length', str(len(HEALTH_RESPONSE)))]
+    
+    def wrapped(environ, start_response):
+        if environ.get('PATH_INFO') == '/health' and environ.get('REQUEST_METHOD') in ('GET', 'HEAD'):
+            start_response('200 OK', headers)
+            return [] if environ['REQUEST_METHOD'] == 'HEAD' else [HEALTH_RESPONSE]
+        return wsgi_app(environ, start_response)
+    
+    return wrapped
+
+app.wsgi_app = serve_health_checks(app.wsgi_app)
+
 if __name__ == '__main__':
-    # Run on all interfaces for Docker
-    app.run(host='0.0.0.0', port=8080, debug=False)
+    # Run on all interfaces for Docker; one thread per request so an upload
+    # never waits behind another client's disk writes
+    app.run(host='0.0.0.0', port=8080, debug=False, threaded=True)